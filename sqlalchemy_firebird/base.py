@@ -1,6 +1,11 @@
 # Allow circular references between FBDialect and FBInspector
 from __future__ import annotations
 
+import contextlib
+import io
+import re
+import time
+
 from packaging import version
 
 from typing import List
@@ -13,13 +18,17 @@ from sqlalchemy import sql
 from sqlalchemy import text
 from sqlalchemy import types as sa_types
 from sqlalchemy import util
+from sqlalchemy.engine import characteristics
 from sqlalchemy.engine import default
 from sqlalchemy.engine import reflection
 from sqlalchemy.engine.interfaces import BindTyping
 from sqlalchemy.sql import coercions
 from sqlalchemy.sql import compiler
+from sqlalchemy.sql import elements
 from sqlalchemy.sql import expression
+from sqlalchemy.sql import operators
 from sqlalchemy.sql import roles
+from sqlalchemy.sql import selectable
 
 import sqlalchemy_firebird.types as fb_types
 
@@ -27,13 +36,532 @@ import sqlalchemy_firebird.types as fb_types
 # Expression separator for COMPUTER BY expressions
 EXPRESSION_SEPARATOR = "||"
 
+# Error codes (with SQLCODE -902) raised when the connection is lost
+DISCONNECT_GDS_CODES = (
+    335544726,  # net_read_err     Error reading data from the connection
+    335544727,  # net_write_err    Error writing data to the connection
+    335544721,  # network_error    Unable to complete network request to host "@1"
+    335544856,  # att_shutdown     Connection shutdown
+)
+
+# Firebird limits the input message (parameters) of a statement to 64KB
+MAX_MESSAGE_LENGTH = 65535
+
+# Each "SELECT ... FROM rdb$database" of a multi-row INSERT uses one context
+#   and Firebird allows up to 255 contexts per statement.
+MAX_INSERT_ROWS = 250
+
+# Bound parameters of these types never receive date or time values
+NAIVE_BIND_TYPES = (
+    sa_types.Integer,
+    sa_types.Numeric,
+    sa_types.String,
+    sa_types.Boolean,
+    sa_types._Binary,
+)
+
+# Firebird derives the type of a bound parameter compared with these
+#   operators from the other operand.
+TYPED_BIND_OPERATORS = {
+    operators.eq,
+    operators.ne,
+    operators.lt,
+    operators.le,
+    operators.gt,
+    operators.ge,
+    operators.like_op,
+    operators.not_like_op,
+    operators.startswith_op,
+    operators.not_startswith_op,
+    operators.is_distinct_from,
+    operators.is_not_distinct_from,
+}
+
+# Values of the pagination_style option
+PAGINATION_STYLES = ("rows", "first_skip", "offset_fetch")
+
+# Collations which ignore case, e.g. UNICODE_CI, UNICODE_CI_AI, ES_ES_CI_AI
+CASE_INSENSITIVE_COLLATION = re.compile(r"_CI(_|$)", re.IGNORECASE)
+
+# Case-insensitive substring search, see containing()
+CONTAINING = operators.custom_op("CONTAINING", is_comparison=True)
+
+# Modes of the OPTIMIZE FOR clause and of the optimize_for option
+OPTIMIZE_FOR_MODES = ("FIRST ROWS", "ALL ROWS")
+
+# Statement hint of a PLAN clause
+PLAN_HINT = re.compile(r"\s*PLAN\b(.*)", re.IGNORECASE | re.DOTALL)
+
+# Tokens of a PLAN expression: quoted identifiers, identifiers, punctuation
+PLAN_TOKEN = re.compile(r'\s*(?:("(?:[^"]|"")+")|([A-Za-z][\w$]*)|([(),]))')
+
 
 def coalesce(*arg):
     # https://stackoverflow.com/questions/4978738/is-there-a-python-equivalent-of-the-c-sharp-null-coalescing-operator#comment37717570_16247152
     return next((a for a in arg if a is not None), None)
 
 
+@contextlib.contextmanager
+def bulk_load(connection, *tables):
+    """Context manager for loading large amounts of rows into ``tables``.
+
+    On enter, the indexes of the tables which do not enforce a constraint are
+    deactivated, and transactions of the connection are started without an
+    undo log (firebird-driver only). On exit, the open transaction is
+    committed (or rolled back on error), then the indexes are reactivated,
+    which rebuilds them, and their statistics are recomputed::
+
+        from sqlalchemy_firebird.base import bulk_load
+
+        engine = create_engine(
+            "firebird+firebird://...", no_garbage_collect=True
+        )
+
+        with engine.connect() as conn:
+            with bulk_load(conn, my_table):
+                conn.execute(my_table.insert(), rows)
+
+    Garbage collection is an attachment option, so it is disabled with the
+    ``no_garbage_collect`` parameter of :func:`_sa.create_engine`, for an
+    engine used only for bulk loading.
+
+    :param connection: a :class:`_engine.Connection` without a transaction in
+     progress.
+    :param tables: :class:`_schema.Table` objects or table names.
+    """
+    if connection.in_transaction():
+        raise exc.InvalidRequestError(
+            "bulk_load() requires a connection without a transaction in "
+            "progress."
+        )
+
+    dialect = connection.dialect
+    quote = dialect.identifier_preparer.quote_identifier
+    index_names = [
+        quote(index_name)
+        for table in tables
+        for index_name in dialect._get_bulk_load_index_names(
+            connection, getattr(table, "name", table)
+        )
+    ]
+    # Ends the transaction of the lookup, as transaction options cannot be
+    #   changed while it is in progress.
+    connection.rollback()
+
+    no_auto_undo = connection.get_execution_options().get(
+        "no_auto_undo", getattr(dialect, "no_auto_undo", False)
+    )
+    deactivated = []
+    try:
+        # DDL() also frees statements which could keep the tables in use.
+        #   Indexes are committed one by one, so that only the deactivated
+        #   ones are reactivated if a deactivation fails.
+        for index_name in index_names:
+            connection.execute(
+                sa_schema.DDL("ALTER INDEX %s INACTIVE" % _escape(index_name))
+            )
+            connection.commit()
+            deactivated.append(index_name)
+
+        connection.execution_options(no_auto_undo=True)
+        try:
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        else:
+            connection.commit()
+        finally:
+            connection.execution_options(no_auto_undo=no_auto_undo)
+    finally:
+        if connection.in_transaction():
+            connection.rollback()
+
+        for index_name in deactivated:
+            connection.execute(
+                sa_schema.DDL("ALTER INDEX %s ACTIVE" % _escape(index_name))
+            )
+        connection.commit()
+
+        for index_name in deactivated:
+            connection.execute(
+                sa_schema.DDL("SET STATISTICS INDEX %s" % _escape(index_name))
+            )
+        connection.commit()
+
+
+def keyset_page(select, order_by, last_row, page_size):
+    """Return the page of ``page_size`` rows of ``select`` which follows
+    ``last_row``, in the ``order_by`` ordering.
+
+    Unlike OFFSET, which makes Firebird produce and discard all the rows of
+    the previous pages, the page starts with a predicate on the ordering
+    columns, ``(a, b) > (:a, :b)`` written out as
+    ``a >= :a AND (a > :a OR (a = :a AND b > :b))``, which an index on
+    ``(a, b)`` can seek to::
+
+        from sqlalchemy_firebird.base import keyset_page
+
+        stmt = select(orders).where(orders.c.status == "shipped")
+        last_row = None
+        while True:
+            page = conn.execute(
+                keyset_page(stmt, [orders.c.id], last_row, 1000)
+            ).all()
+            if not page:
+                break
+            ...
+            last_row = page[-1]
+
+    :param select: a :class:`_sql.Select`. Its ORDER BY clause is replaced.
+    :param order_by: the ordering columns, which must identify a row and
+     not be NULL, each of them optionally with ``.desc()``. An
+     :class:`_schema.Index` (e.g. a reflected one) orders by its columns,
+     descending for indexes with ``firebird_descending``.
+    :param last_row: the last row of the previous page, as a
+     :class:`_engine.Row` which contains the ordering columns or a sequence
+     of their values, or ``None`` for the first page.
+    :param page_size: the number of rows of the page.
+    """
+    if isinstance(order_by, sa_schema.Index):
+        descending = order_by.dialect_options["firebird"]["descending"]
+        keys = [(column, descending is True) for column in order_by.columns]
+    else:
+        keys = [_keyset_key(clause) for clause in order_by]
+
+    if last_row is not None:
+        if hasattr(last_row, "_mapping"):
+            values = [last_row._mapping[column] for column, _ in keys]
+        else:
+            values = list(last_row)
+
+        # Built from the last column: c1 > v1 OR (c1 = v1 AND (c2 > v2 ...))
+        (column, descending), value = keys[-1], values[-1]
+        predicate = column < value if descending else column > value
+        for (column, descending), value in zip(
+            reversed(keys[:-1]), reversed(values[:-1])
+        ):
+            predicate = sql.or_(
+                column < value if descending else column > value,
+                sql.and_(column == value, predicate),
+            )
+        if len(keys) > 1:
+            # Bounds the index scan on the first column
+            (column, descending), value = keys[0], values[0]
+            predicate = sql.and_(
+                column <= value if descending else column >= value, predicate
+            )
+        select = select.where(predicate)
+
+    return (
+        select.order_by(None)
+        .order_by(
+            *[
+                column.desc() if descending else column
+                for column, descending in keys
+            ]
+        )
+        .limit(page_size)
+    )
+
+
+def containing(expr, other):
+    """Return ``expr CONTAINING other``, which is true when the string
+    ``other`` occurs in ``expr``, ignoring case::
+
+        from sqlalchemy_firebird.base import containing
+
+        stmt = select(customers).where(containing(customers.c.name, "smith"))
+
+    Unlike LIKE, ``%`` and ``_`` in ``other`` are not wildcards.
+    """
+    return coercions.expect(roles.ExpressionElementRole, expr).operate(
+        CONTAINING, other
+    )
+
+
+def optimize_for(select, mode):
+    """Return ``select`` with an ``OPTIMIZE FOR FIRST ROWS`` or
+    ``OPTIMIZE FOR ALL ROWS`` clause (Firebird 5+).
+
+    ``"first rows"`` asks for a plan which returns the first rows quickly,
+    e.g. walking an index in the ORDER BY order, ``"all rows"`` for a plan
+    which returns all the rows quickly::
+
+        from sqlalchemy_firebird.base import optimize_for
+
+        stmt = optimize_for(
+            select(orders).order_by(orders.c.id).limit(20), "first rows"
+        )
+
+    The session default is set with the ``optimize_for`` execution option.
+    """
+    # with_statement_hint() modifies the select in some SQLAlchemy releases
+    return select._generate().with_statement_hint(
+        "OPTIMIZE FOR " + _optimize_for_mode(mode), dialect_name="firebird"
+    )
+
+
+def _optimize_for_mode(mode):
+    normalized = mode.replace("_", " ").upper()
+    if normalized not in OPTIMIZE_FOR_MODES:
+        raise exc.ArgumentError(
+            f"Invalid value {mode!r} for optimize_for. Valid values are "
+            f"{', '.join(OPTIMIZE_FOR_MODES)}"
+        )
+    return normalized
+
+
+def _keyset_key(clause):
+    # Returns (column, descending) of an ORDER BY element
+    if isinstance(clause, elements.UnaryExpression) and clause.modifier in (
+        operators.asc_op,
+        operators.desc_op,
+    ):
+        return clause.element, clause.modifier is operators.desc_op
+    return clause, False
+
+
+def _escape(identifier):
+    # DDL() statements are formatted with the % operator
+    return identifier.replace("%", "%%")
+
+
+def _split_values_rows(values):
+    # Splits "(a, b), (c, d) ..." into ["a, b", "c, d"], ignoring parenthesis
+    #   inside quoted literals and identifiers. Also returns the position
+    #   where the rows end.
+    rows = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(values):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "(":
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                rows.append(values[start:i])
+        elif depth == 0 and char not in (",", " "):
+            return rows, i
+
+    return rows, len(values)
+
+
+def _has_case_insensitive_collation(expr):
+    # Columns declared with firebird_case_insensitive, or whose type has a
+    #   collation which ignores case.
+    if isinstance(expr, sa_schema.Column):
+        for column in expr.base_columns:
+            declared = column.dialect_options["firebird"]["case_insensitive"]
+            if declared is not None:
+                return declared
+
+    collation = getattr(expr.type, "collation", None)
+    return (
+        collation is not None
+        and CASE_INSENSITIVE_COLLATION.search(collation) is not None
+    )
+
+
+def _plan_relations(froms):
+    # Relations of the FROM clause, by their name and by the name of the
+    #   table they alias.
+    relations = []
+    stack = list(froms)
+    while stack:
+        from_ = stack.pop(0)
+        if isinstance(from_, selectable.Join):
+            stack[:0] = [from_.left, from_.right]
+            continue
+        name = getattr(from_, "name", None)
+        if isinstance(name, elements._anonymous_label):
+            name = None
+        element = getattr(from_, "element", None)
+        table_name = getattr(element, "name", None)
+        relations.append((from_, name, table_name))
+    return relations
+
+
+def _find_plan_relation(relations, identifier):
+    # The relation named by a PLAN identifier, which is compared as SQL
+    #   compares identifiers: quoted ones exactly, others ignoring case.
+    if identifier.startswith('"'):
+        identifier = identifier[1:-1].replace('""', '"')
+
+        def same(name):
+            return name == identifier
+
+    else:
+
+        def same(name):
+            return name.lower() == identifier.lower()
+
+    for index in (1, 2):
+        matches = [
+            relation[0]
+            for relation in relations
+            if relation[index] is not None and same(relation[index])
+        ]
+        if len(matches) > 1:
+            raise exc.CompileError(
+                f"PLAN relation {identifier!r} is ambiguous"
+            )
+        if matches:
+            return matches[0]
+
+    raise exc.CompileError(
+        f"PLAN relation {identifier!r} is not in the FROM clause"
+    )
+
+
+class _PlanParser:
+    """Validates a PLAN expression and renders it, naming its relations
+    with ``resolve(identifier)``.
+
+    """
+
+    def __init__(self, plan, resolve):
+        self.plan = plan
+        self.resolve = resolve
+        self.tokens = []
+        pos = 0
+        while pos < len(plan):
+            match = PLAN_TOKEN.match(plan, pos)
+            if match is None:
+                self.error()
+            self.tokens.append(match.group(match.lastindex))
+            pos = match.end()
+        self.pos = 0
+
+    def error(self):
+        raise exc.CompileError(f"Invalid PLAN expression {self.plan!r}")
+
+    def peek(self, offset=0):
+        if self.pos + offset < len(self.tokens):
+            return self.tokens[self.pos + offset].upper()
+        return None
+
+    def take(self, *expected):
+        token = self.peek()
+        if token is None or (expected and token not in expected):
+            self.error()
+        self.pos += 1
+        return token
+
+    def parse(self):
+        text = self.plan_expr()
+        if self.peek() is not None:
+            self.error()
+        return text
+
+    def plan_expr(self):
+        keyword = self.peek()
+        if keyword == "(":
+            return self.items(1)
+        if keyword == "SORT" and self.peek(1) == "MERGE":
+            self.take()
+            return "SORT " + self.plan_expr()
+        if keyword == "SORT":
+            self.take()
+            return "SORT " + self.items(1, 1)
+        if keyword in ("JOIN", "HASH", "MERGE"):
+            self.take()
+            return keyword + " " + self.items(2)
+        self.error()
+
+    def items(self, minimum, maximum=None):
+        self.take("(")
+        items = [self.item()]
+        while self.peek() == ",":
+            self.take()
+            items.append(self.item())
+        self.take(")")
+        if len(items) < minimum or (maximum and len(items) > maximum):
+            self.error()
+        return "(%s)" % ", ".join(items)
+
+    def item(self):
+        if self.peek() == "(" or (
+            self.peek() in ("SORT", "JOIN", "HASH", "MERGE")
+            and self.peek(1) in ("(", "MERGE")
+        ):
+            return self.plan_expr()
+
+        # A relation, followed by the relations inside it (views and
+        #   derived tables), and the access method.
+        names = [self.resolve(self.identifier())]
+        while self.peek() not in ("NATURAL", "INDEX", "ORDER"):
+            names.append(self.identifier())
+
+        access = self.take()
+        if access == "INDEX":
+            access += " " + self.index_list()
+        elif access == "ORDER":
+            access += " " + self.identifier()
+            if self.peek() == "INDEX":
+                self.take()
+                access += " INDEX " + self.index_list()
+        return " ".join(names + [access])
+
+    def index_list(self):
+        self.take("(")
+        names = [self.identifier()]
+        while self.peek() == ",":
+            self.take()
+            names.append(self.identifier())
+        self.take(")")
+        return "(%s)" % ", ".join(names)
+
+    def identifier(self):
+        token = self.peek()
+        if token is None or token in ("(", ")", ","):
+            self.error()
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+
 class FBCompiler(sql.compiler.SQLCompiler):
+    # Bound parameter rendered without CAST, see visit_binary()
+    _uncast_bind = None
+
+    def visit_binary(self, binary, **kw):
+        if (
+            self.dialect.minimal_bind_casts
+            and binary.operator in TYPED_BIND_OPERATORS
+        ):
+            left, right = binary.left, binary.right
+            if isinstance(left, elements.BindParameter) != isinstance(
+                right, elements.BindParameter
+            ):
+                self._uncast_bind = (
+                    left if isinstance(left, elements.BindParameter) else right
+                )
+                try:
+                    return super().visit_binary(binary, **kw)
+                finally:
+                    self._uncast_bind = None
+
+        return super().visit_binary(binary, **kw)
+
+    def visit_bindparam(self, bindparam, **kw):
+        if bindparam is self._uncast_bind:
+            kw["render_bind_cast"] = False
+        return super().visit_bindparam(bindparam, **kw)
+
+    def bindparam_string(self, name, render_bind_cast=True, **kw):
+        if not render_bind_cast:
+            kw["bindparam_type"] = None
+        return super().bindparam_string(name, **kw)
+
     def render_bind_cast(self, type_, dbapi_type, sqltext):
         return f"""CAST({sqltext} AS {
             self.dialect.type_compiler_instance.process(
@@ -41,19 +569,185 @@ class FBCompiler(sql.compiler.SQLCompiler):
             )
         })"""
 
+    def _compose_select_body(
+        self,
+        text,
+        select,
+        compile_state,
+        inner_columns,
+        froms,
+        byfrom,
+        toplevel,
+        kwargs,
+    ):
+        # Dialect names are "firebird.<driver>", so hints for the
+        #   "firebird" dialect are rendered here.
+        hints = []
+        plan = ""
+        for dialect_name, hint in select._statement_hints:
+            if dialect_name != "firebird" or self.dialect.name == "firebird":
+                continue
+            match = PLAN_HINT.match(hint)
+            if match is None:
+                hints.append(hint)
+            elif plan:
+                raise exc.CompileError("A SELECT can have only one PLAN.")
+            else:
+                plan = " \nPLAN " + self._render_plan(match.group(1), froms)
+
+        # The PLAN clause precedes ORDER BY, ROWS and FOR UPDATE
+        outer_plan = self._pending_plan
+        self._pending_plan = (select, plan)
+        try:
+            text = super()._compose_select_body(
+                text,
+                select,
+                compile_state,
+                inner_columns,
+                froms,
+                byfrom,
+                toplevel,
+                kwargs,
+            )
+            text += self._take_plan(select)
+        finally:
+            self._pending_plan = outer_plan
+
+        # OPTIMIZE FOR is only valid in the top level SELECT
+        if hints and toplevel:
+            text += " " + self.get_statement_hint_text(hints)
+        return text
+
+    # (select, PLAN clause) of the innermost SELECT being composed
+    _pending_plan = (None, "")
+
+    def _take_plan(self, select):
+        pending_select, plan = self._pending_plan
+        if pending_select is not select:
+            return ""
+        self._pending_plan = (select, "")
+        return plan
+
+    def _render_plan(self, plan, froms):
+        relations = _plan_relations(froms)
+
+        def resolve(identifier):
+            relation = _find_plan_relation(relations, identifier)
+            return relation._compiler_dispatch(self, ashint=True)
+
+        return _PlanParser(plan.strip(), resolve).parse()
+
+    @util.memoized_property
+    def _stream_blob_names(self):
+        # Result columns of streamed BLOB types, named as in the cursor
+        #   description.
+        return [
+            self.dialect.denormalize_name(name)
+            for _, name, _, type_ in self._result_columns
+            if getattr(type_, "stream", False)
+        ]
+
+    @util.memoized_property
+    def _timezone_bind_positions(self):
+        # Positions of the bound parameters which can receive time zone
+        #   aware values. None when positions change on execution.
+        if not self.positional:
+            return None
+
+        binds = {name: bind for bind, name in self.bind_names.items()}
+        positions = []
+        for position, name in enumerate(self.positiontup):
+            bind = binds[name]
+            if bind.expanding or bind.literal_execute:
+                return None
+            if not issubclass(bind.type._type_affinity, NAIVE_BIND_TYPES):
+                positions.append(position)
+        return tuple(positions)
+
     def visit_empty_set_expr(self, element_types, **kw):
         return "SELECT 1 FROM rdb$database WHERE 1 != 1"
 
     def visit_sequence(self, sequence, **kw):
         return "GEN_ID(%s, 1)" % self.preparer.format_sequence(sequence)
 
+    def get_select_precolumns(self, select, **kw):
+        text = super().get_select_precolumns(select, **kw)
+        if not self._use_first_skip(select):
+            return text
+
+        # FIRST / SKIP precede DISTINCT
+        limit_clause = coalesce(select._fetch_clause, select._limit_clause)
+        first_skip = ""
+        if limit_clause is not None:
+            first_skip += "FIRST %s " % self._pagination_value(
+                select, limit_clause, **kw
+            )
+        if select._offset_clause is not None:
+            first_skip += "SKIP %s " % self._pagination_value(
+                select, select._offset_clause, **kw
+            )
+        return first_skip + text
+
+    def _use_first_skip(self, select):
+        # FIRST / SKIP cannot limit the result of a UNION
+        return (
+            self.dialect.pagination_style == "first_skip"
+            and not isinstance(select, expression.CompoundSelect)
+        )
+
+    def _use_offset_fetch(self, select, *clauses):
+        # OFFSET / FETCH only accept integer literals and parameters
+        return self.dialect.pagination_style == "offset_fetch" and all(
+            clause is None
+            or select._simple_int_clause(clause)
+            or isinstance(clause, elements.BindParameter)
+            for clause in clauses
+        )
+
+    def _pagination_value(self, select, clause, **kw):
+        # Simple integers are rendered as literals, so the optimizer knows
+        #   them when the statement is prepared.
+        if select._simple_int_clause(clause):
+            return self.process(clause.render_literal_execute(), **kw)
+        if isinstance(clause, elements.BindParameter):
+            return self.process(clause, render_bind_cast=False, **kw)
+        return "(%s)" % self.process(clause, **kw)
+
+    def _offset_fetch_clause(self, select, offset_clause, fetch_clause, **kw):
+        text = ""
+        if offset_clause is not None:
+            text += "\n OFFSET %s ROWS" % self._pagination_value(
+                select, offset_clause, **kw
+            )
+        if fetch_clause is not None:
+            text += "\n FETCH NEXT %s ROWS ONLY" % self._pagination_value(
+                select, fetch_clause, **kw
+            )
+        return text
+
     def limit_clause(self, select, **kw):
+        if self._use_first_skip(select):
+            return ""
+        if self._use_offset_fetch(
+            select, select._offset_clause, select._limit_clause
+        ):
+            return self._offset_fetch_clause(
+                select, select._offset_clause, select._limit_clause, **kw
+            )
         return self._handle_limit_fetch_clause(
             None, select._offset_clause, select._limit_clause, **kw
         )
 
+    def order_by_clause(self, select, **kw):
+        return self._take_plan(select) + super().order_by_clause(select, **kw)
+
+    def _row_limit_clause(self, select, **kw):
+        return self._take_plan(select) + super()._row_limit_clause(
+            select, **kw
+        )
+
     def for_update_clause(self, select, **kw):
-        tmp = " FOR UPDATE"
+        tmp = self._take_plan(select) + " FOR UPDATE"
         if select._for_update_arg.nowait:
             tmp += " WITH LOCK"
         if select._for_update_arg.skip_locked:
@@ -72,6 +766,12 @@ class FBCompiler(sql.compiler.SQLCompiler):
         if fetch_clause is None:
             fetch_clause = select._fetch_clause
 
+        if self._use_first_skip(select):
+            return ""
+        if self._use_offset_fetch(select, select._offset_clause, fetch_clause):
+            return self._offset_fetch_clause(
+                select, select._offset_clause, fetch_clause, **kw
+            )
         return self._handle_limit_fetch_clause(
             fetch_clause, select._offset_clause, None, **kw
         )
@@ -142,6 +842,110 @@ class FBCompiler(sql.compiler.SQLCompiler):
             self.process(binary.right, **kw),
         )
 
+    def visit_ilike_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_ilike_op_binary(binary, operator, **kw)
+        return self.visit_like_op_binary(ci_binary, operator, **kw)
+
+    def visit_not_ilike_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_not_ilike_op_binary(binary, operator, **kw)
+        return self.visit_not_like_op_binary(ci_binary, operator, **kw)
+
+    def visit_istartswith_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_istartswith_op_binary(binary, operator, **kw)
+        return self.visit_startswith_op_binary(ci_binary, operator, **kw)
+
+    def visit_not_istartswith_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_not_istartswith_op_binary(
+                binary, operator, **kw
+            )
+        return self.visit_not_startswith_op_binary(ci_binary, operator, **kw)
+
+    def visit_iendswith_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_iendswith_op_binary(binary, operator, **kw)
+        return self.visit_endswith_op_binary(ci_binary, operator, **kw)
+
+    def visit_not_iendswith_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_not_iendswith_op_binary(
+                binary, operator, **kw
+            )
+        return self.visit_not_endswith_op_binary(ci_binary, operator, **kw)
+
+    def visit_icontains_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_icontains_op_binary(binary, operator, **kw)
+        return self.visit_contains_op_binary(ci_binary, operator, **kw)
+
+    def visit_not_icontains_op_binary(self, binary, operator, **kw):
+        ci_binary = self._case_insensitive_binary(binary)
+        if ci_binary is None:
+            return super().visit_not_icontains_op_binary(
+                binary, operator, **kw
+            )
+        return self.visit_not_contains_op_binary(ci_binary, operator, **kw)
+
+    def _case_insensitive_binary(self, binary):
+        # The binary of a case-insensitive operator, with its left operand
+        #   compared in a collation which ignores case instead of wrapping
+        #   both operands in lower(). None when there is no such collation.
+        if _has_case_insensitive_collation(binary.left):
+            left = binary.left
+        elif self.dialect.case_insensitive_collation is not None:
+            collation = self.dialect.case_insensitive_collation
+            left = sql.collate(binary.left, sql.quoted_name(collation, False))
+        else:
+            return None
+
+        binary = binary._clone()
+        binary.left = left
+        return binary
+
+    def visit_startswith_op_binary(self, binary, operator, **kw):
+        return self._generate_starting_with(
+            binary, operator, "STARTING WITH", **kw
+        ) or super().visit_startswith_op_binary(binary, operator, **kw)
+
+    def visit_not_startswith_op_binary(self, binary, operator, **kw):
+        return self._generate_starting_with(
+            binary, operator, "NOT STARTING WITH", **kw
+        ) or super().visit_not_startswith_op_binary(binary, operator, **kw)
+
+    def _generate_starting_with(self, binary, operator, keyword, **kw):
+        # STARTING WITH can use an index, unlike LIKE with a parameter, and
+        #   has no wildcards. Values escaped for LIKE (autoescape=True or
+        #   escape) are bound unescaped.
+        if not self.dialect.use_starting_with:
+            return None
+
+        right = binary.right
+        escape = binary.modifiers.get("escape")
+        if escape is not None:
+            if not isinstance(right, elements.BindParameter):
+                return None
+            right = right._with_binary_element_type(
+                fb_types._FBUnescapedString(escape, right.type)
+            )
+            if self._uncast_bind is binary.right:
+                self._uncast_bind = right
+
+        return "%s %s %s" % (
+            binary.left._compiler_dispatch(self, **kw),
+            keyword,
+            right._compiler_dispatch(self, **kw),
+        )
+
     def visit_bitwise_xor_op_binary(self, binary, operator, **kw):
         return "BIN_XOR(%s, %s)" % (
             self.process(binary.left, **kw),
@@ -178,6 +982,145 @@ class FBCompiler(sql.compiler.SQLCompiler):
 
         return "RETURNING " + ", ".join(columns)
 
+    def visit_insert(self, insert_stmt, **kw):
+        text = super().visit_insert(insert_stmt, **kw)
+        if not insert_stmt._multi_values:
+            return text
+
+        # Firebird has no multi-row VALUES, INSERT ... SELECT is used instead
+        values_start = text.index(" VALUES (", text.index("INSERT INTO"))
+        values = text[values_start + len(" VALUES ") :]
+        rows, values_end = _split_values_rows(values)
+        if len(rows) > MAX_INSERT_ROWS:
+            raise exc.CompileError(
+                f"Firebird dialect cannot render a multi-row INSERT with "
+                f"more than {MAX_INSERT_ROWS} rows. Use executemany() "
+                f"(a list of parameter sets) instead."
+            )
+
+        message_length = sum(
+            _parameter_length(bind.type) for bind in self.binds.values()
+        )
+        if message_length > MAX_MESSAGE_LENGTH:
+            raise exc.CompileError(
+                f"Firebird dialect cannot render a multi-row INSERT whose "
+                f"parameters may exceed {MAX_MESSAGE_LENGTH} bytes. Use "
+                f"executemany() (a list of parameter sets) instead."
+            )
+
+        if (
+            insert_stmt._returning
+            and self.dialect.server_version_info
+            and self.dialect.server_version_info < (5,)
+        ):
+            # INSERT ... SELECT ... RETURNING returns only one row.
+            raise exc.CompileError(
+                "RETURNING of a multi-row INSERT requires Firebird 5.0 or "
+                "higher."
+            )
+
+        return (
+            text[:values_start]
+            + " "
+            + self._render_values_as_union(values[:values_end].rstrip())
+            + (" " + values[values_end:] if values_end < len(values) else "")
+        )
+
+    def _deliver_insertmanyvalues_batches(
+        self,
+        statement,
+        parameters,
+        compiled_parameters,
+        generic_setinputsizes,
+        batch_size,
+        sort_by_parameter_order,
+        schema_translate_map,
+    ):
+        # Signature of SQLAlchemy 2.0.21+ (see dependencies in pyproject.toml)
+        # Firebird has no multi-row VALUES. Each batch rendered by SQLAlchemy
+        #   is rewritten into INSERT ... SELECT ... FROM rdb$database UNION ALL
+        imv = self._insertmanyvalues
+        if imv.is_default_expr:
+            # DEFAULT cannot be used in a select list, use row at a time.
+            yield from super()._deliver_insertmanyvalues_batches(
+                statement,
+                parameters,
+                compiled_parameters,
+                generic_setinputsizes,
+                1,
+                sort_by_parameter_order,
+                schema_translate_map,
+            )
+            return
+
+        single_values_expr = imv.single_values_expr
+        if schema_translate_map:
+            single_values_expr = self.preparer._render_schema_translates(
+                single_values_expr, schema_translate_map
+            )
+
+        # Each batch has "VALUES (...), (...)" between prefix and suffix
+        prefix, _, suffix = statement.partition(f"({single_values_expr})")
+        prefix = prefix[: -len(" VALUES")]
+
+        batch_size = min(
+            batch_size,
+            MAX_INSERT_ROWS,
+            max(1, MAX_MESSAGE_LENGTH // self._insertmanyvalues_row_length()),
+        )
+
+        for batch in super()._deliver_insertmanyvalues_batches(
+            statement,
+            parameters,
+            compiled_parameters,
+            generic_setinputsizes,
+            batch_size,
+            sort_by_parameter_order,
+            schema_translate_map,
+        ):
+            if batch.is_downgraded:
+                yield batch
+                continue
+
+            end = len(batch.replaced_statement) - len(suffix)
+            values = batch.replaced_statement[
+                len(prefix) + len(" VALUES") : end
+            ]
+            yield batch._replace(
+                replaced_statement=prefix
+                + self._render_values_as_union(values)
+                + suffix
+            )
+
+    def _render_values_as_union(self, values):
+        # (a, b), (c, d)  =>  SELECT a, b FROM rdb$database UNION ALL
+        #                     SELECT c, d FROM rdb$database
+        return " UNION ALL ".join(
+            f"SELECT {row}{self.default_from()}"
+            for row in _split_values_rows(values)[0]
+        )
+
+    def _insertmanyvalues_row_length(self):
+        # Worst case estimation of the message length used by each row.
+        length = sum(
+            _parameter_length(column.type) * len(bind_keys)
+            for column, _, _, bind_keys in (
+                self._insertmanyvalues.insert_crud_params
+            )
+        )
+        return max(length, 1)
+
+
+def _parameter_length(type_):
+    # Worst case estimation of the message length used by a parameter.
+    type_length = 16
+    if isinstance(type_, sa_types.String) and type_.length:
+        # UTF8 uses up to 4 bytes per character, plus VARCHAR length
+        type_length = type_.length * 4 + 2
+
+    # Parameters are aligned and have a null indicator
+    return type_length + 4
+
 
 class FBDDLCompiler(sql.compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
@@ -518,6 +1461,21 @@ class FBIdentifierPreparer(sql.compiler.IdentifierPreparer):
 
 
 class FBExecutionContext(default.DefaultExecutionContext):
+    def create_server_side_cursor(self):
+        # Firebird cursors already fetch rows from the server as they are
+        #   consumed. Only the fetch size needs to follow the buffer size.
+        cursor = self._dbapi_connection.cursor()
+        arraysize = self.execution_options.get(
+            "yield_per"
+        ) or self.execution_options.get("max_row_buffer")
+        if arraysize:
+            cursor.arraysize = arraysize
+        return cursor
+
+    def pre_exec(self):
+        super().pre_exec()
+        self.dialect._apply_optimize_for(self._dbapi_connection)
+
     def fire_sequence(self, seq, type_):
         return self._execute_scalar(
             (
@@ -559,12 +1517,52 @@ class FBInspector(reflection.Inspector):
             )
 
 
+class FBCommitRetainingCharacteristic(
+    characteristics.ConnectionCharacteristic
+):
+    """The ``commit_retaining`` execution option.
+
+    When enabled, :meth:`.FBDialect.do_commit` uses COMMIT RETAINING, which
+    keeps the transaction context open for the next statements.
+    """
+
+    transactional = False
+
+    def reset_characteristic(self, dialect, dbapi_conn):
+        dialect._set_commit_retaining(dbapi_conn, False)
+
+    def set_characteristic(self, dialect, dbapi_conn, value):
+        dialect._set_commit_retaining(dbapi_conn, value)
+
+    def get_characteristic(self, dialect, dbapi_conn):
+        return dialect._get_commit_retaining(dbapi_conn)
+
+
+class FBOptimizeForCharacteristic(characteristics.ConnectionCharacteristic):
+    """The ``optimize_for`` execution option, which sets the optimization
+    mode of the session (``SET OPTIMIZE``, Firebird 5+).
+
+    """
+
+    transactional = False
+
+    def reset_characteristic(self, dialect, dbapi_conn):
+        dialect._set_optimize_for(dbapi_conn, None)
+
+    def set_characteristic(self, dialect, dbapi_conn, value):
+        dialect._set_optimize_for(dbapi_conn, value)
+
+    def get_characteristic(self, dialect, dbapi_conn):
+        return dialect._get_optimize_for(dbapi_conn)
+
+
 class FBDialect(default.DefaultDialect):
     bind_typing = BindTyping.RENDER_CASTS
 
     supports_alter = True
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
+    supports_server_side_cursors = True
 
     supports_native_boolean = True  # False for Firebird 2.5
     supports_native_decimal = True
@@ -573,7 +1571,17 @@ class FBDialect(default.DefaultDialect):
     supports_sequences = True
     sequences_optional = False
     postfetch_lastrowid = False
-    use_insertmanyvalues = False
+
+    # Multi-row RETURNING requires Firebird 5.0+ (see initialize)
+    use_insertmanyvalues = True
+    supports_multivalues_insert = True
+    if hasattr(compiler, "InsertmanyvaluesSentinelOpts"):
+        # Not available in SQLAlchemy 1.4.
+        insertmanyvalues_implicit_sentinel = (
+            compiler.InsertmanyvaluesSentinelOpts.AUTOINCREMENT
+            | compiler.InsertmanyvaluesSentinelOpts.IDENTITY
+            | compiler.InsertmanyvaluesSentinelOpts.USE_INSERT_FROM_SELECT
+        )
 
     supports_comments = True
     supports_default_values = True
@@ -599,6 +1607,10 @@ class FBDialect(default.DefaultDialect):
 
     requires_name_normalize = True
 
+    # Python encoding of the connection character set, used to encode text
+    #   chunks of BLOB parameters.
+    _blob_encoding = "utf-8"
+
     colspecs = {
         sa_types.String: fb_types._FBString,
         sa_types.Numeric: fb_types._FBNumeric,
@@ -641,6 +1653,12 @@ class FBDialect(default.DefaultDialect):
     }
 
     construct_arguments = [
+        (
+            sa_schema.Column,
+            {
+                "case_insensitive": None,
+            },
+        ),
         (
             sa_schema.Table,
             {
@@ -658,6 +1676,41 @@ class FBDialect(default.DefaultDialect):
 
     using_sqlalchemy2 = version.parse(SQLALCHEMY_VERSION).major >= 2
 
+    connection_characteristics = (
+        default.DefaultDialect.connection_characteristics.union(
+            {
+                "commit_retaining": FBCommitRetainingCharacteristic(),
+                "optimize_for": FBOptimizeForCharacteristic(),
+            }
+        )
+    )
+
+    def __init__(
+        self,
+        commit_retaining_max_count=100,
+        commit_retaining_max_age=60,
+        no_garbage_collect=False,
+        minimal_bind_casts=False,
+        pagination_style="rows",
+        case_insensitive_collation=None,
+        use_starting_with=False,
+        **kwargs,
+    ):
+        if pagination_style not in PAGINATION_STYLES:
+            raise exc.ArgumentError(
+                f"Invalid value {pagination_style!r} for pagination_style. "
+                f"Valid values are {', '.join(PAGINATION_STYLES)}"
+            )
+
+        super().__init__(**kwargs)
+        self.pagination_style = pagination_style
+        self.no_garbage_collect = no_garbage_collect
+        self.minimal_bind_casts = minimal_bind_casts
+        self.case_insensitive_collation = case_insensitive_collation
+        self.use_starting_with = use_starting_with
+        self.commit_retaining_max_count = commit_retaining_max_count
+        self.commit_retaining_max_age = commit_retaining_max_age
+
     def initialize(self, connection):
         super().initialize(connection)
 
@@ -667,6 +1720,9 @@ class FBDialect(default.DefaultDialect):
 
             self.supports_identity_columns = False
             self.supports_native_boolean = False
+            if self.pagination_style == "offset_fetch":
+                # OFFSET / FETCH is available since Firebird 3.0
+                self.pagination_style = "first_skip"
         elif self.server_version_info < (4,):
             # Firebird 3.0
             from .fb_info30 import MAX_IDENTIFIER_LENGTH, RESERVED_WORDS
@@ -677,6 +1733,14 @@ class FBDialect(default.DefaultDialect):
         self.max_identifier_length = MAX_IDENTIFIER_LENGTH
         self.preparer.reserved_words = RESERVED_WORDS
 
+        if self.server_version_info < (5,):
+            # INSERT ... SELECT ... RETURNING returns only one row.
+            self.use_insertmanyvalues = False
+            self.__dict__.pop("insert_executemany_returning", None)
+            self.__dict__.pop(
+                "insert_executemany_returning_sort_by_parameter_order", None
+            )
+
     @reflection.cache
     def has_table(self, connection, table_name, schema=None, **kw):
         has_table_query = """
@@ -1263,16 +2327,107 @@ class FBDialect(default.DefaultDialect):
             for row in result.mappings()
         ]
 
+    def do_commit(self, dbapi_connection):
+        dbapi_connection.commit(
+            retaining=self._use_commit_retaining(dbapi_connection)
+        )
+
+    def _set_commit_retaining(self, dbapi_connection, value):
+        # [commits retained, start of the transaction context]
+        self.get_driver_connection(dbapi_connection)._commit_retaining = (
+            [0, time.monotonic()] if value else None
+        )
+
+    def _get_commit_retaining(self, dbapi_connection):
+        driver_connection = self.get_driver_connection(dbapi_connection)
+        state = getattr(driver_connection, "_commit_retaining", None)
+        return state is not None
+
+    def _use_commit_retaining(self, dbapi_connection):
+        # A retained transaction context keeps the oldest active transaction
+        #   from advancing, so it is periodically ended with a hard commit.
+        state = getattr(dbapi_connection, "_commit_retaining", None)
+        if state is None:
+            return False
+
+        state[0] += 1
+        now = time.monotonic()
+        if (
+            state[0] > self.commit_retaining_max_count
+            or now - state[1] > self.commit_retaining_max_age
+        ):
+            state[:] = [0, now]
+            return False
+        return True
+
+    def _set_optimize_for(self, dbapi_connection, value):
+        # [requested mode, mode of the session]. SET OPTIMIZE runs in a
+        #   transaction, so it is deferred to the next execution.
+        driver_connection = self.get_driver_connection(dbapi_connection)
+        state = getattr(driver_connection, "_optimize_for", None)
+        mode = None if value is None else _optimize_for_mode(value)
+        if state is None:
+            driver_connection._optimize_for = [mode, None]
+        else:
+            state[0] = mode
+
+    def _get_optimize_for(self, dbapi_connection):
+        driver_connection = self.get_driver_connection(dbapi_connection)
+        state = getattr(driver_connection, "_optimize_for", None)
+        return state[0] if state is not None else None
+
+    def _apply_optimize_for(self, dbapi_connection):
+        driver_connection = self.get_driver_connection(dbapi_connection)
+        state = getattr(driver_connection, "_optimize_for", None)
+        if state is None or state[0] == state[1]:
+            return
+
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(
+                "SET OPTIMIZE TO DEFAULT"
+                if state[0] is None
+                else "SET OPTIMIZE FOR " + state[0]
+            )
+        finally:
+            cursor.close()
+        state[1] = state[0]
+
+    def _open_blob_stream(self, value, segment_size):
+        # Result value of a streamed BLOB type. The driver has already
+        #   fetched the whole BLOB.
+        if isinstance(value, str):
+            return io.StringIO(value)
+        return io.BytesIO(value)
+
+    def _get_bulk_load_index_names(self, connection, table_name):
+        # Active user indexes which do not enforce a constraint
+        indexes_query = """
+            SELECT TRIM(ix.rdb$index_name) AS index_name
+            FROM rdb$indices ix
+            WHERE ix.rdb$relation_name = ?
+              AND COALESCE(ix.rdb$index_inactive, 0) = 0
+              AND COALESCE(ix.rdb$system_flag, 0) = 0
+              AND ix.rdb$foreign_key IS NULL
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM rdb$relation_constraints rc
+                  WHERE rc.rdb$index_name = ix.rdb$index_name
+              )
+            ORDER BY ix.rdb$index_name
+        """
+        return [
+            row.index_name
+            for row in connection.exec_driver_sql(
+                indexes_query, (self.denormalize_name(table_name),)
+            )
+        ]
+
     def is_disconnect(self, e, connection, cursor):
         is_fdb = self.driver == "fdb"
         if isinstance(e, (self.dbapi.DatabaseError)):
             sqlcode = e.args[1] if is_fdb else e.sqlcode
-            gdscode = e.args[2] if is_fdb else e.gds_codes[0]
-            return sqlcode == -902 and gdscode in (
-                335544726,  # net_read_err     Error reading data from the connection
-                335544727,  # net_write_err    Error writing data to the connection
-                335544721,  # network_error    Unable to complete network request to host "@1"
-                335544856,  # att_shutdown     Connection shutdown
-            )
+            gdscode = e.args[2] if is_fdb else next(iter(e.gds_codes), None)
+            return sqlcode == -902 and gdscode in DISCONNECT_GDS_CODES
 
         return False
@@ -39,6 +39,9 @@ class FBDialect_fdb(FBDialect):
 
         util.coerce_kw_type(opts, "type_conv", int)
 
+        if self.no_garbage_collect:
+            opts["no_gc"] = 1
+
         return ([], opts)
 
     def _get_server_version_info(self, connection):
@@ -50,5 +53,23 @@ class FBDialect_fdb(FBDialect):
         minor, major = modf(dbapi_connection.engine_version)
         return (int(major), int(minor * 10))
 
+    def do_ping(self, dbapi_connection):
+        # A database info request is a single round trip, without preparing
+        #   and executing a statement.
+        try:
+            dbapi_connection.database_info(
+                self.dbapi.isc_info_ods_version, "i"
+            )
+        except self.dbapi.Error as err:
+            if not self.using_sqlalchemy2 and self.is_disconnect(
+                err, dbapi_connection, None
+            ):
+                # For SQLAlchemy 1.4 compatibility only. In 2.0 disconnects
+                #   raised by do_ping() are handled by the pool.
+                return False
+            raise
+
+        return True
+
 
 dialect = FBDialect_fdb
@@ -8,23 +8,477 @@
 
     The firebird-driver package provides driver for Python 3.8+ and Firebird 3+. 
     This driver uses new Firebird OO API provided by fbclient library.
+
+Batched executemany
+-------------------
+
+On Firebird 4+ servers (and fbclient 4+) ``executemany()`` calls are sent
+through the Firebird batch interface (``IBatch``), which transfers many
+parameter sets in a single round trip instead of one round trip per row.
+The number of rows sent per round trip is set with the
+``executemany_batch_size`` parameter of :func:`_sa.create_engine`::
+
+    engine = create_engine(
+        "firebird+firebird://...", executemany_batch_size=5000
+    )
+
+Rows with large parameters are sent in smaller round trips, so that each
+one fits in the 10 MB batch buffer.
+
+Use ``executemany_batch_size=0`` to disable batching. Statements which
+return rows or which have BLOB or ARRAY parameters always use the plain
+driver ``executemany()``.
+
+Read-only connections
+---------------------
+
+The ``READ COMMITTED READ ONLY`` isolation level runs every statement in
+a read-only READ COMMITTED transaction, which is committed automatically.
+Firebird starts such transactions pre-committed, so they never hold back
+garbage collection, even when a connection sits idle. It is intended for
+reporting engines, which can set it for every connection with the
+``read_only`` parameter of :func:`_sa.create_engine`::
+
+    engine = create_engine("firebird+firebird://...", read_only=True)
+
+Lock resolution
+---------------
+
+By default transactions wait indefinitely for locks held by concurrent
+transactions. The ``lock_timeout`` option sets the lock resolution of the
+transactions started by a connection: ``None`` for WAIT, ``0`` for NO WAIT,
+or a number of seconds for LOCK TIMEOUT. The ``read_committed_mode``
+option sets the READ COMMITTED variant: ``"RECORD VERSION"`` (default),
+``"NO RECORD VERSION"`` or ``"READ CONSISTENCY"`` (Firebird 4+). The
+``no_auto_undo`` option starts transactions without an undo log, see
+:func:`.bulk_load`. All of them can be set for an engine, as parameters
+of :func:`_sa.create_engine`, or for a connection, as execution options::
+
+    engine = create_engine("firebird+firebird://...", lock_timeout=2)
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(
+            isolation_level="READ COMMITTED",
+            read_committed_mode="READ CONSISTENCY",
+            lock_timeout=0,
+        )
+
+Prepared statement cache
+------------------------
+
+Each pooled connection can keep an LRU cache of prepared statements, keyed
+by SQL text, so that statements executed repeatedly are prepared on the
+server only once. The cache is disabled by default, as prepared statements
+hold metadata locks on the tables they use, which block DDL on those
+tables from other connections. It is enabled with the
+``prepared_statement_cache_size`` parameter of :func:`_sa.create_engine`,
+or the same URL query parameter::
+
+    engine = create_engine(
+        "firebird+firebird://...", prepared_statement_cache_size=100
+    )
+
+The cache of a connection is available as
+``connection.connection.info["prepared_statement_cache"]``, with ``hits``,
+``misses`` and ``evictions`` counters.
+
+COMMIT RETAINING
+----------------
+
+With the ``commit_retaining`` execution option, commits use Firebird's
+COMMIT RETAINING, which keeps the transaction context, so the next
+statements do not start a new transaction::
+
+    engine = create_engine(
+        "firebird+firebird://...",
+        execution_options={"commit_retaining": True},
+    )
+
+A retained transaction context keeps the oldest active transaction from
+advancing. A hard commit is therefore made after
+``commit_retaining_max_count`` retaining commits (default 100), or when the
+transaction context is older than ``commit_retaining_max_age`` seconds
+(default 60). Both are parameters of :func:`_sa.create_engine`. The option
+is also supported by the fdb dialect.
+
+Bound parameter casts
+---------------------
+
+Bound parameters are rendered as ``CAST(? AS type)``, so that Firebird
+knows their type wherever they appear. With the ``minimal_bind_casts``
+parameter of :func:`_sa.create_engine`, parameters compared with a
+column or another expression (``=``, ``<>``, ``<``, ``>``, ``<=``, ``>=``,
+``LIKE`` and ``IS [NOT] DISTINCT FROM``) are rendered as plain ``?``
+markers, which take the type of the other operand. Parameters in the
+select list, in function and ``CASE`` arguments, in ``IN`` lists and in
+comparisons between two parameters are still cast::
+
+    engine = create_engine("firebird+firebird://...", minimal_bind_casts=True)
+
+The option is also supported by the fdb dialect.
+
+Pagination
+----------
+
+LIMIT and OFFSET are rendered as ``ROWS m + 1 TO m + n`` by default. The
+``pagination_style`` parameter of :func:`_sa.create_engine` selects
+``"first_skip"`` (``SELECT FIRST n SKIP m ...``) or ``"offset_fetch"``
+(``OFFSET m ROWS FETCH NEXT n ROWS ONLY``, Firebird 3+; Firebird 2.5 uses
+FIRST / SKIP instead). With both, integer values are rendered as literals,
+so that the optimizer can choose a plan which walks an index for the first
+rows::
+
+    engine = create_engine(
+        "firebird+firebird://...", pagination_style="offset_fetch"
+    )
+
+Expressions which these clauses do not accept, and FIRST / SKIP on UNIONs,
+are rendered with ROWS. The option is also supported by the fdb dialect.
+
+Deep pages still make Firebird produce and discard the rows of all the
+previous pages. :func:`.keyset_page` starts each page after the last row
+of the previous one instead, with a predicate which an index can seek to.
+
+Optimization mode
+-----------------
+
+Firebird 5 optimizes a SELECT either to return all its rows quickly, or to
+return its first rows quickly, which favors plans walking an index in the
+ORDER BY order. :func:`.optimize_for` adds an ``OPTIMIZE FOR FIRST ROWS``
+or ``OPTIMIZE FOR ALL ROWS`` clause to a select. The ``optimize_for``
+execution option sets the mode of the session (``SET OPTIMIZE``) for the
+next statements of a connection, until the connection is returned to the
+pool::
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(optimize_for="all rows")
+
+Both accept ``"first rows"`` and ``"all rows"``. The option is also
+supported by the fdb dialect.
+
+Prefix and substring search
+---------------------------
+
+With the ``use_starting_with`` parameter of :func:`_sa.create_engine`,
+:meth:`_sql.ColumnOperators.startswith` is rendered as ``STARTING WITH``,
+which, unlike ``LIKE ? || '%'``, can use an index. STARTING WITH has no
+wildcards, so ``%`` and ``_`` in the value match themselves, rather than
+any characters as with LIKE; values escaped with ``autoescape=True`` or
+``escape`` are unescaped when they are bound. :func:`.containing` renders
+Firebird's ``CONTAINING``, a case-insensitive substring search::
+
+    engine = create_engine("firebird+firebird://...", use_starting_with=True)
+
+    stmt = select(customers).where(customers.c.name.startswith("Smi"))
+    stmt = select(customers).where(containing(customers.c.name, "smi"))
+
+Case-insensitive comparisons
+----------------------------
+
+:meth:`_sql.ColumnOperators.ilike`, ``istartswith()``, ``iendswith()``
+and ``icontains()`` wrap both operands in ``lower()``, which an index on
+the column cannot serve. They are rendered without ``lower()``:
+
+* for columns whose collation ignores case, from the collation of their
+  type (e.g. ``UNICODE_CI`` or ``UNICODE_CI_AI``) or declared with
+  ``firebird_case_insensitive=True``, so that an index on the column can
+  be used::
+
+    Column("email", String(100), firebird_case_insensitive=True)
+
+* for other columns, with ``COLLATE`` and the collation given by the
+  ``case_insensitive_collation`` parameter of :func:`_sa.create_engine`,
+  which must belong to the character set of the columns::
+
+    engine = create_engine(
+        "firebird+firebird://...", case_insensitive_collation="UNICODE_CI"
+    )
+
+``istartswith()`` is rendered as ``STARTING WITH``, like ``startswith()``.
+``firebird_case_insensitive=False`` keeps ``lower()`` for a column. The
+options are also supported by the fdb dialect.
+
+PLAN clauses
+------------
+
+A PLAN clause is given as a statement hint for the ``"firebird"``
+dialect. Relations are named by their alias or by their table name, and
+are rendered with the name the compiler gives them in the FROM clause.
+The plan is validated (``JOIN``, ``HASH``, ``MERGE``, ``SORT``,
+``NATURAL``, ``INDEX`` and ``ORDER``) and rendered before the ORDER BY
+clause::
+
+    stmt = (
+        select(orders.c.id, customers.c.name)
+        .join_from(orders, customers)
+        .order_by(orders.c.id)
+        .with_statement_hint(
+            "PLAN JOIN (orders ORDER pk_orders, customers INDEX (pk_customers))",
+            dialect_name="firebird",
+        )
+    )
+
+Streaming BLOBs
+---------------
+
+Columns of :class:`.FBBLOB` or :class:`.FBTEXT` type with ``stream=True``
+return file-like objects (binary or text) instead of ``bytes`` or
+``str``. They read the BLOB from the server on demand, through the
+firebird-driver ``BlobReader``, ``stream_segment_size`` bytes at a time::
+
+    documents = Table(
+        "documents",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("content", FBBLOB(stream=True, stream_segment_size=1 << 20)),
+    )
+
+    with engine.connect() as conn:
+        for row in conn.execute(select(documents)):
+            shutil.copyfileobj(row.content, target)
+
+A stream can be read while the cursor of its row is open. The cursor is
+closed once all rows have been fetched, so the rows of
+:meth:`_engine.Result.all` hold closed streams. The firebird_async dialect
+returns file-like objects over fetched values.
+
+BLOB parameters accept ``bytes``, ``str`` (text BLOBs), buffers such as
+``bytearray`` or ``memoryview``, readable file-like objects and iterables
+of chunks. Buffers are not copied as a whole, and file-like objects and
+iterables are written into the BLOB segment by segment, as they are read::
+
+    with open("report.pdf", "rb") as f:
+        conn.execute(documents.insert(), {"id": 1, "content": f})
+
+Inline BLOBs
+------------
+
+Firebird 5.0.3+ servers and clients can send BLOBs up to a size limit
+inline with the row, without a separate round trip per BLOB to open, read
+and close it. The limit is set for every connection with the
+``max_inline_blob_size`` parameter of :func:`_sa.create_engine`, or the
+same URL query parameter, and ``0`` disables inline BLOBs::
+
+    engine = create_engine(
+        "firebird+firebird://...?max_inline_blob_size=16384"
+    )
+
+Older servers and client libraries ignore it. firebird-driver has no API
+to set the limit per statement.
+
+Session time zone
+-----------------
+
+Time zone aware ``datetime`` and ``time`` parameters are converted to
+firebird-driver time zone objects, which are cached by name. With the
+``session_time_zone`` parameter of :func:`_sa.create_engine` (or the same
+URL query parameter), connections use that session time zone (Firebird
+4+), and time zone aware ``datetime`` parameters are converted to it
+with ``astimezone()``, instead of resolving their time zone by name::
+
+    engine = create_engine(
+        "firebird+firebird://...", session_time_zone="Europe/Prague"
+    )
+
+The converted values represent the same instant, but TIMESTAMP WITH TIME
+ZONE columns store the session time zone instead of the original one.
+
+Server and database registration
+--------------------------------
+
+For URLs with a host name, the dialect registers the server and the
+database in the firebird-driver ``driver_config``, under the names
+``host:port`` and ``host:port:database``. Engines created for the same URL
+share the registered entries, which are removed once all of them have been
+disposed with :meth:`_engine.Engine.dispose`.
 """  # noqa
 
+import collections
+import contextvars
+import functools
+import io
+import struct
+import threading
+import weakref
+
+from ctypes import byref
+from ctypes import create_string_buffer
+from ctypes import memmove
 from datetime import datetime
 from datetime import time
+from datetime import timezone
+from decimal import Decimal
 from math import modf
+from typing import NamedTuple
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import util
+from sqlalchemy.engine import characteristics
 from .base import FBDialect
 
 import firebird.driver
+from firebird.driver import core as fb_core
 from firebird.driver import driver_config
+from firebird.driver import fbapi
+from firebird.driver import get_api
 from firebird.driver import get_timezone
+from firebird.driver import Isolation
+from firebird.driver import TPB
+from firebird.driver import TraAccessMode
+from firebird.driver.hooks import add_hook
+from firebird.driver.hooks import ConnectionHook
+from firebird.driver.interfaces import iBatch
+from firebird.driver.interfaces import iBatchCompletionState
+from firebird.driver.types import DPBItem
+from firebird.driver.types import SQLDataType
+from firebird.driver.types import XpbKind
+
+# Connect arguments computed by create_connect_args(), per URL. Entries are
+#   removed once no engine uses them, as URLs include the password.
+_connect_args_cache = {}
+
+# Number of engines using each URL and each driver_config server and database
+#   entry.
+_driver_config_refs = collections.Counter()
+
+# Guards _connect_args_cache, _driver_config_refs and driver_config entries.
+_driver_config_lock = threading.Lock()
+
+# URL query keys which are handled by the dialect.
+DIALECT_QUERY_KEYS = {
+    "fb_client_library",
+    "prepared_statement_cache_size",
+    "max_inline_blob_size",
+}
+
+# Time zones of firebird-driver, by name. Creating them is costly.
+_get_timezone = functools.lru_cache(maxsize=128)(get_timezone)
+
+# isc_dpb_max_inline_blob_size (Firebird 5.0.3+), not in firebird-driver.
+DPB_MAX_INLINE_BLOB_SIZE = 103
+
+# Additional DPB items of the connection being attached, as (tag, value)
+#   pairs. See _attach_request().
+_attach_dpb_items = contextvars.ContextVar("_attach_dpb_items", default=())
+
+# Values of the read_committed_mode option.
+READ_COMMITTED_MODES = {
+    "RECORD VERSION": Isolation.READ_COMMITTED_RECORD_VERSION,
+    "NO RECORD VERSION": Isolation.READ_COMMITTED_NO_RECORD_VERSION,
+    "READ CONSISTENCY": Isolation.READ_COMMITTED_READ_CONSISTENCY,
+}
+
+# Size of the buffer of a batch (TAG_BUFFER_BYTES_SIZE), which holds the
+#   messages added before it is executed. Firebird's default is 10 MB.
+BATCH_BUFFER_SIZE = 10 * 1024 * 1024
+
+# Parameter types which can be packed into a batch message.
+BATCH_PARAMETER_TYPES = {
+    SQLDataType.TEXT,
+    SQLDataType.VARYING,
+    SQLDataType.SHORT,
+    SQLDataType.LONG,
+    SQLDataType.INT64,
+    SQLDataType.INT128,
+    SQLDataType.FLOAT,
+    SQLDataType.DOUBLE,
+    SQLDataType.DATE,
+    SQLDataType.TIME,
+    SQLDataType.TIME_TZ,
+    SQLDataType.TIMESTAMP,
+    SQLDataType.TIMESTAMP_TZ,
+    SQLDataType.DEC16,
+    SQLDataType.DEC34,
+    SQLDataType.BOOLEAN,
+}
+
+
+class TPBOptions(NamedTuple):
+    """Parameters of the default TPB of a connection."""
+
+    isolation_level: str
+    lock_timeout: Optional[int]
+    read_committed_mode: Optional[str]
+    no_auto_undo: bool
+
+
+class FBTPBOptionCharacteristic(characteristics.ConnectionCharacteristic):
+    """The ``lock_timeout``, ``read_committed_mode`` and ``no_auto_undo``
+    execution options, which set parameters of the transactions started by
+    the connection.
+
+    """
+
+    __slots__ = ("option",)
+
+    transactional = True
+
+    def __init__(self, option):
+        self.option = option
+
+    def reset_characteristic(self, dialect, dbapi_conn):
+        dialect._set_tpb_options(
+            dbapi_conn, **{self.option: getattr(dialect, self.option)}
+        )
+
+    def set_characteristic(self, dialect, dbapi_conn, value):
+        dialect._set_tpb_options(dbapi_conn, **{self.option: value})
+
+    def get_characteristic(self, dialect, dbapi_conn):
+        return getattr(dialect._get_tpb_options(dbapi_conn), self.option)
 
 
 class FBDialect_firebird(FBDialect):
     name = "firebird.firebird"
     driver = "firebird-driver"
     supports_statement_cache = True
+    supports_sane_multi_rowcount = True
+
+    def __init__(
+        self,
+        executemany_batch_size=1000,
+        prepared_statement_cache_size=0,
+        read_only=False,
+        lock_timeout=None,
+        read_committed_mode=None,
+        no_auto_undo=False,
+        max_inline_blob_size=None,
+        session_time_zone=None,
+        **kwargs,
+    ):
+        if read_only:
+            isolation_level = kwargs.setdefault(
+                "isolation_level", "READ COMMITTED READ ONLY"
+            )
+            if isolation_level != "READ COMMITTED READ ONLY":
+                raise exc.ArgumentError(
+                    "read_only=True cannot be combined with "
+                    f"isolation_level={isolation_level!r}"
+                )
+
+        super().__init__(**kwargs)
+        self.lock_timeout = lock_timeout
+        self.read_committed_mode = read_committed_mode
+        self.no_auto_undo = no_auto_undo
+        self._tpb_cache = {}
+        self.executemany_batch_size = executemany_batch_size
+        self.prepared_statement_cache_size = prepared_statement_cache_size
+        self.max_inline_blob_size = max_inline_blob_size
+        self.session_time_zone = session_time_zone
+        self._session_timezone = None
+        self._driver_config_key = None
+        self._driver_config_registered = False
+
+    connection_characteristics = FBDialect.connection_characteristics.union(
+        {
+            "lock_timeout": FBTPBOptionCharacteristic("lock_timeout"),
+            "read_committed_mode": FBTPBOptionCharacteristic(
+                "read_committed_mode"
+            ),
+            "no_auto_undo": FBTPBOptionCharacteristic("no_auto_undo"),
+        }
+    )
 
     @classmethod
     def dbapi(cls):
@@ -37,18 +491,108 @@ class FBDialect_firebird(FBDialect):
 
     @util.memoized_property
     def _isolation_lookup(self):
+        # Transaction parameters (TPB) of each isolation level
         return {
-            "AUTOCOMMIT": "autocommit",
-            "READ COMMITTED": "read_committed",
-            "REPEATABLE READ": "repeatable_read",
-            "SERIALIZABLE": "serializable",
+            "AUTOCOMMIT": {
+                "isolation": Isolation.READ_COMMITTED_RECORD_VERSION,
+                "auto_commit": True,
+            },
+            "READ COMMITTED": {
+                "isolation": Isolation.READ_COMMITTED_RECORD_VERSION,
+            },
+            "READ COMMITTED READ ONLY": {
+                "isolation": Isolation.READ_COMMITTED_RECORD_VERSION,
+                "access_mode": TraAccessMode.READ,
+                "auto_commit": True,
+            },
+            "REPEATABLE READ": {
+                "isolation": Isolation.SNAPSHOT,
+            },
+            "SERIALIZABLE": {
+                "isolation": Isolation.SERIALIZABLE,
+            },
         }
 
     def get_isolation_level_values(self, dbapi_connection):
         return list(self._isolation_lookup)
 
+    def get_isolation_level(self, dbapi_connection):
+        return self._get_tpb_options(dbapi_connection).isolation_level
+
     def set_isolation_level(self, dbapi_connection, level):
-        dbapi_connection.set_isolation_level(self._isolation_lookup[level])
+        self._set_tpb_options(dbapi_connection, isolation_level=level)
+
+    def on_connect(self):
+        super_connect = super().on_connect()
+        if (
+            self.lock_timeout is None
+            and self.read_committed_mode is None
+            and not self.no_auto_undo
+        ):
+            return super_connect
+
+        def set_tpb_options(dbapi_connection):
+            if super_connect is not None:
+                super_connect(dbapi_connection)
+            self._set_tpb_options(
+                dbapi_connection,
+                lock_timeout=self.lock_timeout,
+                read_committed_mode=self.read_committed_mode,
+                no_auto_undo=self.no_auto_undo,
+            )
+
+        return set_tpb_options
+
+    def _get_tpb_options(self, dbapi_connection):
+        return _connection_tpb_options(dbapi_connection)
+
+    def _set_tpb_options(self, dbapi_connection, **kw):
+        options = _connection_tpb_options(dbapi_connection)._replace(**kw)
+        tpb = self._get_tpb(options)
+
+        transaction = dbapi_connection.main_transaction
+        if transaction.is_active():
+            # The TPB is used when the next transaction starts. There is no
+            #   SQLAlchemy transaction in progress at this point.
+            transaction.commit()
+        transaction.default_tpb = tpb
+        dbapi_connection._tpb_options = options
+
+    def _get_tpb(self, options):
+        try:
+            return self._tpb_cache[options]
+        except KeyError:
+            pass
+
+        params = dict(self._isolation_lookup[options.isolation_level])
+
+        if options.lock_timeout is not None:
+            if not isinstance(options.lock_timeout, int) or (
+                options.lock_timeout < 0
+            ):
+                raise exc.ArgumentError(
+                    f"Invalid value {options.lock_timeout!r} for "
+                    "lock_timeout. Use None (WAIT), 0 (NO WAIT) or a "
+                    "number of seconds (LOCK TIMEOUT)."
+                )
+            params["lock_timeout"] = options.lock_timeout
+
+        if options.read_committed_mode is not None:
+            mode = options.read_committed_mode.replace("_", " ").upper()
+            if mode not in READ_COMMITTED_MODES:
+                raise exc.ArgumentError(
+                    f"Invalid value {options.read_committed_mode!r} for "
+                    "read_committed_mode. Valid values are "
+                    f"{', '.join(READ_COMMITTED_MODES)}"
+                )
+            if params["isolation"] == Isolation.READ_COMMITTED_RECORD_VERSION:
+                params["isolation"] = READ_COMMITTED_MODES[mode]
+
+        if options.no_auto_undo:
+            params["no_auto_undo"] = True
+
+        tpb = self._tpb_cache[options] = TPB(**params).get_buffer()
+        return tpb
 
     def set_readonly(self, connection, value):
         connection.readonly = value
@@ -65,50 +609,113 @@ class FBDialect_firebird(FBDialect):
     def do_terminate(self, dbapi_connection) -> None:
         dbapi_connection.terminate()
 
+    @classmethod
+    def engine_created(cls, engine):
+        event.listen(engine, "engine_disposed", cls._on_engine_disposed)
+
+    @staticmethod
+    def _on_engine_disposed(engine):
+        engine.dialect._unregister_driver_config()
+
     def create_connect_args(self, url):
-        opts = url.translate_connect_args(username="user")
-
-        qry = url.query
-        if qry.get("fb_client_library"):
-            # Set driver_config.fb_client_library and remove it from remaining keys passed to .connect()
-            driver_config.fb_client_library.value = qry["fb_client_library"]
-            qry = remove_keys(qry, {"fb_client_library"})
-
-        if opts.get("host"):
-            host_name = opts["host"]
-            database_name = opts["database"]
-
-            port_number = "3050"
-            if opts.get("port") is not None:
-                port_number = str(opts["port"])
-                del opts["port"]
-
-            cfg_driver_server = driver_config.get_server(host_name)
-            if cfg_driver_server is None:
-                cfg_driver_server = driver_config.register_server(host_name)
-            cfg_driver_server.host.value = host_name
-            cfg_driver_server.port.value = port_number
-
-            cfg_driver_database = driver_config.get_database(database_name)
-            if cfg_driver_database is None:
-                cfg_driver_database = driver_config.register_database(
-                    database_name
-                )
-            cfg_driver_database.server.value = host_name
-            cfg_driver_database.database.value = opts["database"]
+        # Connect arguments are computed once per URL. Engines created for
+        #   the same URL share the cached arguments and driver_config entries.
+        try:
+            cached = _connect_args_cache[url]
+        except KeyError:
+            with _driver_config_lock:
+                cached = _connect_args_cache.get(url)
+                if cached is None:
+                    cached = _connect_args_cache[url] = _connect_args(url)
+
+        opts, fb_client_library, registration = cached
+
+        if "prepared_statement_cache_size" in url.query:
+            self.prepared_statement_cache_size = int(
+                url.query["prepared_statement_cache_size"]
+            )
+        if "max_inline_blob_size" in url.query:
+            self.max_inline_blob_size = int(url.query["max_inline_blob_size"])
+        if "session_time_zone" in url.query:
+            self.session_time_zone = url.query["session_time_zone"]
 
-            del opts["host"]
+        if (
+            fb_client_library
+            and driver_config.fb_client_library.value != fb_client_library
+        ):
+            driver_config.fb_client_library.value = fb_client_library
 
-        opts.update(qry)
+        self._unregister_driver_config()
+        self._driver_config_key = (url, registration)
+        self._register_driver_config()
+
+        opts = dict(opts)
+        # As firebird.driver.connect(), which upper-cases the charset
+        charset = opts.get("charset")
+        self._blob_encoding = fb_core.CHARSET_MAP.get(
+            charset.upper() if charset else charset, "ascii"
+        )
+        if self.no_garbage_collect:
+            opts["no_gc"] = True
+        if self.session_time_zone:
+            opts["session_time_zone"] = self.session_time_zone
+            self._session_timezone = _get_timezone(self.session_time_zone)
         return ([], opts)
 
+    def connect(self, *cargs, **cparams):
+        # Entries are registered again if the engine is used after dispose()
+        self._register_driver_config()
+
+        if self.max_inline_blob_size is None:
+            return super().connect(*cargs, **cparams)
+
+        token = _attach_dpb_items.set(
+            ((DPB_MAX_INLINE_BLOB_SIZE, self.max_inline_blob_size),)
+        )
+        try:
+            return super().connect(*cargs, **cparams)
+        finally:
+            _attach_dpb_items.reset(token)
+
+    def _register_driver_config(self):
+        if self._driver_config_key is None or self._driver_config_registered:
+            return
+
+        with _driver_config_lock:
+            if not self._driver_config_registered:
+                _acquire_driver_config(*self._driver_config_key)
+                self._driver_config_registered = True
+
+    def _unregister_driver_config(self):
+        """Release the driver_config entries registered by
+        :meth:`.create_connect_args`. Entries are removed from driver_config,
+        and connect arguments from their cache, once no engine uses them.
+        Called when the engine is disposed.
+
+        """
+        if not self._driver_config_registered:
+            return
+
+        with _driver_config_lock:
+            if self._driver_config_registered:
+                _release_driver_config(*self._driver_config_key)
+                self._driver_config_registered = False
+
     def do_rollback(self, dbapi_connection):
         if dbapi_connection.is_active():
             dbapi_connection.rollback()
 
     def do_commit(self, dbapi_connection):
         if dbapi_connection.is_active():
-            dbapi_connection.commit()
+            dbapi_connection.commit(
+                retaining=self._use_commit_retaining(dbapi_connection)
+            )
+
+    def do_ping(self, dbapi_connection):
+        # Native attachment ping, without preparing and executing a statement.
+        #   Disconnect errors are detected by is_disconnect().
+        dbapi_connection.ping()
+        return True
 
     def _get_server_version_info(self, connection):
         dbapi_connection = (
@@ -121,21 +728,672 @@ class FBDialect_firebird(FBDialect):
 
     def adapt_timezone(self, param):
         # Convert tzinfo for firebird-driver. Requires tzinfo.tzname() method implemented.
-        if isinstance(param, datetime) and param.tzinfo:
-            return param.replace(tzinfo=get_timezone(param.tzname()))
-        elif isinstance(param, time) and param.tzinfo:
-            return param.replace(tzinfo=get_timezone(param.tzname()))
-        return param
+        if not isinstance(param, (datetime, time)):
+            return param
+
+        tzinfo = param.tzinfo
+        if tzinfo is None or tzinfo is self._session_timezone:
+            return param
+        if self._session_timezone is not None and isinstance(param, datetime):
+            return param.astimezone(self._session_timezone)
+        if hasattr(tzinfo, "_timezone_"):
+            # Already a firebird-driver time zone
+            return param
+        return param.replace(tzinfo=_driver_timezone(param))
+
+    def _timezone_positions(self, context, parameters):
+        # Positions of the parameters passed to adapt_timezone(), computed
+        #   once per compiled statement. None when every parameter is.
+        if context is None or context.compiled is None or context.isddl:
+            return None
+
+        compiled = context.compiled
+        positions = compiled._timezone_bind_positions
+        if positions is None or len(parameters) != len(compiled.positiontup):
+            # E.g. multi-row INSERT statements
+            return None
+        return positions
+
+    def _adapt_parameters(self, parameters, positions):
+        if positions is None:
+            return [self.adapt_timezone(p) for p in parameters]
+
+        adapted_parameters = list(parameters)
+        for i in positions:
+            adapted_parameters[i] = self.adapt_timezone(parameters[i])
+        return adapted_parameters
 
     def do_execute(self, cursor, statement, parameters, context=None):
         # Firebird-driver needs special time zone handling.
         #   https://github.com/FirebirdSQL/python3-driver/issues/19#issuecomment-1523045743
-        adapted_parameters = [self.adapt_timezone(p) for p in parameters]
-        super().do_execute(cursor, statement, adapted_parameters, context)
+        positions = self._timezone_positions(context, parameters)
+        if positions != ():
+            parameters = self._adapt_parameters(parameters, positions)
+
+        cache = self._get_prepared_statement_cache(context)
+        if cache is not None:
+            statement = self._cached_statement(
+                cache, cursor, statement, context
+            )
+
+        if (
+            context is not None
+            and context.compiled is not None
+            and not context.isddl
+        ):
+            stream_blobs = context.compiled._stream_blob_names
+            if stream_blobs:
+                self._set_stream_blobs(cursor, stream_blobs)
+
+        super().do_execute(cursor, statement, parameters, context)
+
+    def _set_stream_blobs(self, cursor, names):
+        # BlobReader objects are returned for these columns
+        cursor.stream_blobs = names
+
+    def _open_blob_stream(self, value, segment_size):
+        if not isinstance(value, fb_core.BlobReader):
+            return super()._open_blob_stream(value, segment_size)
+
+        is_text = value.is_text()
+        stream = io.BufferedReader(_BlobRawIO(value), segment_size)
+        if is_text:
+            # Decoded here, as segments can split multibyte characters
+            stream = io.TextIOWrapper(stream, value._charset)
+            stream._CHUNK_SIZE = segment_size
+        return stream
+
+    def _get_prepared_statement_cache(self, context):
+        if not self.prepared_statement_cache_size or context is None:
+            return None
+
+        # The cache lives as long as the pooled DBAPI connection.
+        info = context._dbapi_connection.info
+        try:
+            return info["prepared_statement_cache"]
+        except KeyError:
+            cache = info["prepared_statement_cache"] = PreparedStatementCache(
+                self.prepared_statement_cache_size
+            )
+            return cache
+
+    def _cached_statement(self, cache, cursor, statement, context):
+        if context.isddl:
+            # Cached statements keep metadata locks on their objects
+            cache.clear()
+        elif context.compiled is not None:
+            return cache.get(cursor, statement)
+        return statement
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        positions = None
+        if parameters:
+            positions = self._timezone_positions(context, parameters[0])
+
+        if positions == ():
+            adapted_parameters = parameters
+        else:
+            adapted_parameters = [
+                self._adapt_parameters(row, positions) for row in parameters
+            ]
+
+        if self._use_batch(context, adapted_parameters):
+            if not cursor.transaction.is_active():
+                cursor.transaction.begin()
+            statement_handle = cursor.prepare(statement)
+            try:
+                if _batch_supported(statement_handle, adapted_parameters):
+                    rowcounts = self._execute_batch(
+                        cursor, statement_handle, adapted_parameters
+                    )
+                    if context is not None:
+                        context._rowcount = sum(rowcounts)
+                    return
+            finally:
+                statement_handle.free()
+
+        if context is not None and (context.isupdate or context.isdelete):
+            # cursor.rowcount only reports the last execution
+            rowcount = 0
+            for row in adapted_parameters:
+                cursor.execute(statement, row)
+                rowcount += cursor.rowcount
+            context._rowcount = rowcount
+            return
+
+        cursor.executemany(statement, adapted_parameters)
+
+    def _use_batch(self, context, parameters):
+        if not self.executemany_batch_size or len(parameters) < 2:
+            return False
+
+        if self.server_version_info < (4,):
+            # Batch interface is available since Firebird 4.0
+            return False
+
+        if context is not None and context.compiled is not None:
+            # Batches cannot return rows
+            if context.compiled.effective_returning:
+                return False
+
+        return True
+
+    def _execute_batch(self, cursor, statement_handle, parameters):
+        # Firebird-driver doesn't expose IBatch, so it's used directly
+        #   from the OO API interfaces. Returns the number of rows affected
+        #   by each set of parameters.
+        #   https://github.com/FirebirdSQL/firebird/blob/master/doc/Using_OO_API.html
+        transaction = cursor.transaction
+        with statement_handle._in_meta.get_builder() as builder:
+            for i in range(statement_handle._in_meta.get_count()):
+                if statement_handle._in_meta.get_type(i) == SQLDataType.TEXT:
+                    # Send CHAR parameters as VARCHAR to avoid padding them.
+                    builder.set_type(i, SQLDataType.VARYING)
+            batch_meta = builder.get_metadata()
+
+        rowcounts = []
+        try:
+            with get_api().util.get_xpb_builder(XpbKind.BATCH) as xpb:
+                xpb.insert_int(iBatch.TAG_RECORD_COUNTS, 1)
+                xpb.insert_int(iBatch.TAG_BUFFER_BYTES_SIZE, BATCH_BUFFER_SIZE)
+                batch_parameters = xpb.get_buffer()
+
+            batch = statement_handle._istmt.create_batch(
+                batch_meta, batch_parameters
+            )
+            try:
+                # The messages added before each execute() must fit in the
+                #   batch buffer.
+                message_length = batch_meta.get_aligned_length()
+                batch_size = max(
+                    1,
+                    min(
+                        self.executemany_batch_size,
+                        BATCH_BUFFER_SIZE // message_length,
+                    ),
+                )
+                for start in range(0, len(parameters), batch_size):
+                    rows = parameters[start : start + batch_size]
+                    buffer = create_string_buffer(message_length * len(rows))
+                    for i, row in enumerate(rows):
+                        _pack_batch_message(
+                            batch_meta,
+                            buffer,
+                            i * message_length,
+                            row,
+                            cursor.connection._encoding,
+                        )
+
+                    batch.add(len(rows), buffer)
+                    completion_state = batch.execute(transaction._tra)
+                    try:
+                        rowcounts.extend(_batch_rowcounts(completion_state))
+                    finally:
+                        completion_state.dispose()
+            finally:
+                batch.release()
+        finally:
+            batch_meta.release()
+
+        return rowcounts
+
+
+class PreparedStatementCache:
+    """LRU cache of the prepared statements of one firebird-driver
+    connection, keyed by SQL text.
+
+    ``hits``, ``misses`` and ``evictions`` count the cache lookups, the
+    statements prepared on the server, and the statements freed to make
+    room for new ones.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # sql -> [Statement, weak reference to the last executing cursor]
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, cursor, sql):
+        """Return the prepared statement to execute ``sql`` on ``cursor``.
+
+        Returns ``sql`` itself when the statement cannot be cached, and
+        the driver prepares it as usual.
+        """
+        entry = self._entries.get(sql)
+        if entry is not None:
+            if entry[1]() is not cursor and _has_open_result(entry):
+                # The statement can only have one open result set, and it
+                #   belongs to another cursor.
+                self.misses += 1
+                return sql
+
+            self.hits += 1
+            self._entries.move_to_end(sql)
+            entry[1] = weakref.ref(cursor)
+            return entry[0]
+
+        self.misses += 1
+        if len(self._entries) >= self.size and not self._evict():
+            return sql
+
+        prepared = cursor.prepare(sql)
+        self._entries[sql] = [prepared, weakref.ref(cursor)]
+        return prepared
+
+    def clear(self):
+        """Free all cached statements."""
+        entries, self._entries = self._entries, collections.OrderedDict()
+        for entry in entries.values():
+            # Statements with an open result set are freed by the garbage
+            #   collector or when the connection is closed.
+            if not _has_open_result(entry):
+                entry[0].free()
+
+    def _evict(self):
+        for sql, entry in self._entries.items():
+            if not _has_open_result(entry):
+                del self._entries[sql]
+                entry[0].free()
+                self.evictions += 1
+                return True
+        return False
+
+
+class _BlobRawIO(io.RawIOBase):
+    """Raw binary stream over a firebird-driver BlobReader."""
+
+    def __init__(self, reader):
+        super().__init__()
+        self._reader = reader
+        # Read bytes, also from text BLOBs
+        reader.sub_type = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._reader._blob is None:
+            raise ValueError(
+                "BLOB stream is closed; BLOB streams can only be read while "
+                "the cursor of their row is open"
+            )
+        data = self._reader.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._reader.seek(offset, whence)
+        return self._reader.tell()
+
+    def tell(self):
+        return self._reader.tell()
+
+    def close(self):
+        if not self.closed:
+            self._reader.close()
+        super().close()
+
+
+def _driver_timezone(value):
+    # firebird-driver time zone of a time zone aware datetime or time
+    tzinfo = value.tzinfo
+    if isinstance(tzinfo, timezone) or hasattr(tzinfo, "key"):
+        # Fixed offsets and zoneinfo regions have one name
+        return _tzinfo_timezone(tzinfo)
+    return _get_timezone(value.tzname())
+
+
+@functools.lru_cache(maxsize=128)
+def _tzinfo_timezone(tzinfo):
+    return _get_timezone(getattr(tzinfo, "key", None) or tzinfo.tzname(None))
+
+
+def _has_open_result(entry):
+    statement, cursor_ref = entry
+    cursor = cursor_ref()
+    return (
+        cursor is not None
+        and cursor._stmt is statement
+        and cursor._result is not None
+    )
+
+
+def _connection_tpb_options(dbapi_connection):
+    options = getattr(dbapi_connection, "_tpb_options", None)
+    if options is None:
+        # TPB of the driver, or set by the application
+        options = _parse_tpb_options(
+            dbapi_connection.main_transaction.default_tpb
+        )
+    return options
+
+
+def _parse_tpb_options(buffer):
+    tpb = TPB()
+    tpb.parse_buffer(buffer)
+
+    if tpb.auto_commit:
+        if tpb.access_mode == TraAccessMode.READ:
+            isolation_level = "READ COMMITTED READ ONLY"
+        else:
+            isolation_level = "AUTOCOMMIT"
+    elif tpb.isolation == Isolation.SNAPSHOT:
+        isolation_level = "REPEATABLE READ"
+    elif tpb.isolation == Isolation.SERIALIZABLE:
+        isolation_level = "SERIALIZABLE"
+    else:
+        isolation_level = "READ COMMITTED"
+
+    read_committed_mode = None
+    for mode, isolation in READ_COMMITTED_MODES.items():
+        if tpb.isolation == isolation and mode != "RECORD VERSION":
+            read_committed_mode = mode
+
+    lock_timeout = None if tpb.lock_timeout < 0 else tpb.lock_timeout
+    return TPBOptions(
+        isolation_level, lock_timeout, read_committed_mode, tpb.no_auto_undo
+    )
+
+
+def _attach_request(dsn, dpb):
+    # firebird-driver ConnectionHook.ATTACH_REQUEST hook, which attaches with
+    #   the DPB items that connect() does not support.
+    dpb_items = _attach_dpb_items.get()
+    if not dpb_items:
+        return None
+
+    sql_dialect = 3
+    charset = None
+    utf8filename = False
+    with get_api().util.get_xpb_builder(XpbKind.DPB, dpb) as builder:
+        while not builder.is_eof():
+            tag = builder.get_tag()
+            if tag == DPBItem.SQL_DIALECT:
+                sql_dialect = builder.get_int()
+            elif tag == DPBItem.LC_CTYPE:
+                charset = builder.get_string()
+            elif tag == DPBItem.UTF8_FILENAME:
+                utf8filename = True
+            builder.move_next()
+        for tag, value in dpb_items:
+            builder.insert_int(tag, value)
+        dpb = builder.get_buffer()
+
+    encoding = "utf-8" if utf8filename else fb_core.FS_ENCODING
+    with get_api().master.get_dispatcher() as provider:
+        att = provider.attach_database(dsn, dpb, encoding)
+    return firebird.driver.Connection(att, dsn, dpb, sql_dialect, charset)
+
+
+add_hook(
+    ConnectionHook.ATTACH_REQUEST, firebird.driver.Connection, _attach_request
+)
 
 
 def remove_keys(d, keys):
     return {x: d[x] for x in d if x not in keys}
 
 
+def _connect_args(url):
+    opts = url.translate_connect_args(username="user")
+
+    # Dialect options are not .connect() arguments
+    qry = remove_keys(url.query, DIALECT_QUERY_KEYS)
+    fb_client_library = url.query.get("fb_client_library")
+
+    registration = None
+    if opts.get("host"):
+        host_name = opts.pop("host")
+        port_number = str(opts.pop("port", None) or "3050")
+        database = opts["database"]
+
+        # Names are unique per server and database, so URLs for the same
+        #   database path on different servers do not overwrite each other.
+        server_name = f"{host_name}:{port_number}"
+        database_name = f"{server_name}:{database}"
+        registration = (
+            server_name,
+            host_name,
+            port_number,
+            database_name,
+            database,
+        )
+        opts["database"] = database_name
+
+    opts.update(qry)
+    return (opts, fb_client_library, registration)
+
+
+def _acquire_driver_config(url, registration):
+    # Must be called with _driver_config_lock held.
+    _driver_config_refs[url] += 1
+    if registration is None:
+        return
+
+    server_name, host_name, port_number, database_name, database = registration
+    if _driver_config_refs[server_name] == 0:
+        cfg_driver_server = driver_config.get_server(server_name)
+        if cfg_driver_server is None:
+            cfg_driver_server = driver_config.register_server(server_name)
+        cfg_driver_server.host.value = host_name
+        cfg_driver_server.port.value = port_number
+    _driver_config_refs[server_name] += 1
+
+    if _driver_config_refs[database_name] == 0:
+        cfg_driver_database = driver_config.get_database(database_name)
+        if cfg_driver_database is None:
+            cfg_driver_database = driver_config.register_database(
+                database_name
+            )
+        cfg_driver_database.server.value = server_name
+        cfg_driver_database.database.value = database
+    _driver_config_refs[database_name] += 1
+
+
+def _release_driver_config(url, registration):
+    # Must be called with _driver_config_lock held. The lists are replaced
+    #   rather than modified, as .connect() may iterate them concurrently.
+    _driver_config_refs[url] -= 1
+    if _driver_config_refs[url] == 0:
+        del _driver_config_refs[url]
+        _connect_args_cache.pop(url, None)
+
+    if registration is None:
+        return
+
+    server_name, _, _, database_name, _ = registration
+    _driver_config_refs[database_name] -= 1
+    if _driver_config_refs[database_name] == 0:
+        del _driver_config_refs[database_name]
+        driver_config.databases.value = [
+            db
+            for db in driver_config.databases.value
+            if db.name != database_name
+        ]
+
+    _driver_config_refs[server_name] -= 1
+    if _driver_config_refs[server_name] == 0:
+        del _driver_config_refs[server_name]
+        driver_config.servers.value = [
+            srv
+            for srv in driver_config.servers.value
+            if srv.name != server_name
+        ]
+
+
+def _batch_supported(statement_handle, parameters):
+    # IStatement.createBatch() requires fbclient 4.0+
+    if not hasattr(statement_handle._istmt, "create_batch"):
+        return False
+
+    if statement_handle._out_cnt > 0:
+        return False
+
+    in_meta = statement_handle._in_meta
+    if in_meta is None:
+        return False
+
+    types = [in_meta.get_type(i) for i in range(in_meta.get_count())]
+    if not all(t in BATCH_PARAMETER_TYPES for t in types):
+        return False
+
+    # Batch messages have a fixed format, so the driver's implicit conversion
+    #   of string values into any other parameter type is not available.
+    non_string_positions = [
+        i
+        for i, t in enumerate(types)
+        if t not in (SQLDataType.TEXT, SQLDataType.VARYING)
+    ]
+    return not any(
+        isinstance(row[i], (str, bytes))
+        for row in parameters
+        for i in non_string_positions
+    )
+
+
+def _pack_batch_message(meta, buffer, start, parameters, encoding):
+    # Stores one set of parameters into a batch message. Mirrors
+    #   firebird.driver.Cursor._pack_input() for the BATCH_PARAMETER_TYPES,
+    #   but it never changes the message metadata (all messages of a batch
+    #   must share the same format).
+    for i, value in enumerate(parameters):
+        buffer[start + meta.get_null_offset(i)] = 1 if value is None else 0
+        if value is None:
+            continue
+
+        length = meta.get_length(i)
+        data = BATCH_PACKERS[meta.get_type(i)](
+            meta, i, value, length, encoding
+        )
+        if meta.get_type(i) == SQLDataType.VARYING:
+            length = len(data)
+        memmove(byref(buffer, start + meta.get_offset(i)), data, length)
+
+
+def _pack_varying(meta, i, value, length, encoding):
+    if not isinstance(value, (str, bytes, bytearray)):
+        value = str(value)
+    if isinstance(value, str):
+        value = value.encode(encoding)
+    if len(value) > length:
+        raise firebird.driver.DataError(
+            f"Value of parameter ({i}) is too long,"
+            f" expected {length}, found {len(value)}"
+        )
+    return len(value).to_bytes(2, "little") + bytes(value)
+
+
+def _pack_integer(meta, i, value, length, encoding):
+    datatype = meta.get_type(i)
+    subtype = meta.get_subtype(i)
+    scale = meta.get_scale(i)
+    if subtype or scale:
+        # NUMERIC or DECIMAL, scale may be 0
+        if isinstance(value, Decimal):
+            value = int((value * fb_core._ten_to[-scale]).to_integral())
+        elif isinstance(value, (int, float)):
+            value = int(value * fb_core._ten_to[-scale])
+        else:
+            raise firebird.driver.DataError(
+                f"Objects of type {type(value)} are not acceptable input "
+                f"for a fixed-point parameter ({i})."
+            )
+    try:
+        # Range of SQL dialect 3 types
+        fb_core._check_integer_range(value, 3, datatype, subtype, scale)
+    except ValueError as error:
+        raise firebird.driver.DataError(str(error)) from error
+    return value.to_bytes(length, "little", signed=True)
+
+
+def _pack_int128(meta, i, value, length, encoding):
+    return fb_core._util.get_int128().from_str(str(value), meta.get_scale(i))
+
+
+def _pack_boolean(meta, i, value, length, encoding):
+    return (1 if value else 0).to_bytes(length, "little")
+
+
+def _pack_date(meta, i, value, length, encoding):
+    return fb_core._util.encode_date(value).to_bytes(
+        length, "little", signed=True
+    )
+
+
+def _pack_time(meta, i, value, length, encoding):
+    return fb_core._util.encode_time(value).to_bytes(length, "little")
+
+
+# Packers of batch message values, by parameter type. Each one returns the
+#   data of value, as stored in the message.
+BATCH_PACKERS = {
+    SQLDataType.VARYING: _pack_varying,
+    SQLDataType.SHORT: _pack_integer,
+    SQLDataType.LONG: _pack_integer,
+    SQLDataType.INT64: _pack_integer,
+    SQLDataType.INT128: _pack_int128,
+    SQLDataType.FLOAT: lambda meta, i, value, *args: struct.pack("f", value),
+    SQLDataType.DOUBLE: lambda meta, i, value, *args: struct.pack("d", value),
+    SQLDataType.BOOLEAN: _pack_boolean,
+    SQLDataType.DATE: _pack_date,
+    SQLDataType.TIME: _pack_time,
+    SQLDataType.TIME_TZ: lambda meta, i, value, *args: (
+        fb_core._util.encode_time_tz(value)
+    ),
+    SQLDataType.TIMESTAMP: lambda meta, i, value, *args: (
+        fb_core._encode_timestamp(value)
+    ),
+    SQLDataType.TIMESTAMP_TZ: lambda meta, i, value, *args: (
+        fb_core._util.encode_timestamp_tz(value)
+    ),
+    SQLDataType.DEC16: lambda meta, i, value, *args: byref(
+        fb_core._util.get_decfloat16().from_str(str(value))
+    ),
+    SQLDataType.DEC34: lambda meta, i, value, *args: (
+        fb_core._util.get_decfloat34().from_str(str(value))
+    ),
+}
+
+
+def _batch_rowcounts(completion_state):
+    position = completion_state.find_error(0)
+    if position == iBatchCompletionState.NO_MORE_ERRORS:
+        return [
+            completion_state.get_state(i)
+            for i in range(completion_state.get_size())
+        ]
+
+    status = completion_state.get_status(position)
+    try:
+        raise firebird.driver.DatabaseError(
+            "Error while executing batch message #%d:\n%s"
+            % (position, fb_core._util.format_status(status)),
+            gds_codes=_gds_codes(status.get_errors()),
+            sqlcode=fbapi.api.isc_sqlcode(status.get_errors()),
+        )
+    finally:
+        status.dispose()
+
+
+def _gds_codes(status_vector):
+    # Same extraction done by firebird-driver when raising DatabaseError
+    gds_codes = []
+    i = 0
+    while status_vector[i] != 0:
+        if status_vector[i] == 1:
+            i += 1
+            if (status_vector[i] & 0x14000000) == 0x14000000:
+                gds_codes.append(status_vector[i])
+        i += 1
+    return tuple(gds_codes)
+
+
 dialect = FBDialect_firebird
@@ -1,4 +1,6 @@
+import contextlib
 import datetime as dt
+import re
 
 from typing import Any
 from typing import Optional
@@ -11,6 +13,9 @@ BINARY_CHARSET = "OCTETS"
 # Character set of NCHAR/NVARCHAR
 NATIONAL_CHARSET = "ISO8859_1"
 
+# Default number of bytes read at a time from streamed BLOBs
+STREAM_SEGMENT_SIZE = 65536
+
 
 class _FBString(sqltypes.String):
     render_bind_cast = True
@@ -20,6 +25,33 @@ class _FBString(sqltypes.String):
         self.charset = charset
 
 
+class _FBUnescapedString(sqltypes.TypeDecorator):
+    """A string escaped for LIKE with ``escape``, bound as the literal string
+    it matches (for STARTING WITH). ``impl`` is the type of the escaped
+    value, whose cast and bind processing are kept.
+
+    """
+
+    impl = sqltypes.String
+    cache_ok = True
+
+    def __init__(self, escape, impl):
+        super().__init__()
+        self.impl = impl
+        self.escape = escape
+
+    def _unwrapped_dialect_impl(self, dialect):
+        # Renders the cast of impl, even when impl is a TypeDecorator
+        return self.impl_instance._unwrapped_dialect_impl(dialect)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return re.sub(
+            re.escape(self.escape) + "(.)", r"\1", value, flags=re.DOTALL
+        )
+
+
 class FBCHAR(_FBString):
     __visit_name__ = "CHAR"
 
@@ -151,23 +183,105 @@ class FBBOOLEAN(sqltypes.BOOLEAN):
 
 
 class _FBLargeBinary(sqltypes.LargeBinary):
+    """Base of the BLOB types.
+
+    With ``stream=True``, values are returned as file-like objects which read
+    the BLOB from the server on demand, ``stream_segment_size`` bytes at a
+    time (64 KiB by default). Streamed values remain readable while the
+    cursor of their row is open, e.g. while iterating over the result.
+    Drivers which cannot stream BLOBs return file-like objects over the
+    fetched value.
+    """
+
     render_bind_cast = True
 
     def __init__(
-        self, subtype=None, segment_size=None, charset=None, collation=None
+        self,
+        subtype=None,
+        segment_size=None,
+        charset=None,
+        collation=None,
+        stream=False,
+        stream_segment_size=None,
     ):
         super().__init__()
         self.subtype = subtype
         self.segment_size = segment_size
         self.charset = charset
         self.collation = collation
+        self.stream = stream
+        self.stream_segment_size = stream_segment_size
 
     def bind_processor(self, dialect):
+        encoding = dialect._blob_encoding
+
         def process(value):
-            return None if value is None else bytes(value)
+            if value is None or isinstance(value, (bytes, str)):
+                return value
+            if hasattr(value, "read"):
+                # Drivers stream file-like objects into the BLOB
+                return value
+            try:
+                buffer = memoryview(value)
+            except TypeError:
+                return _BlobChunkReader(value, encoding)
+            return _BlobChunkReader((buffer,), encoding)
 
         return process
 
+    def result_processor(self, dialect, coltype):
+        if self.stream:
+            segment_size = self.stream_segment_size or STREAM_SEGMENT_SIZE
+
+            def process(value):
+                if value is None:
+                    return None
+                return dialect._open_blob_stream(value, segment_size)
+
+        else:
+
+            def process(value):
+                if hasattr(value, "read"):
+                    # Drivers stream BLOBs over a size threshold
+                    with contextlib.closing(value):
+                        value = value.read()
+                if value is None or isinstance(value, str):
+                    return value
+                return bytes(value)
+
+        return process
+
+
+class _BlobChunkReader:
+    """File-like object over a buffer or an iterable of chunks, which the
+    drivers write into a BLOB parameter segment by segment.
+
+    Buffers are read in slices, so they are not copied as a whole. Text
+    chunks are encoded with ``encoding``, so that segments are sliced and
+    sized in bytes.
+    """
+
+    def __init__(self, chunks, encoding):
+        self._chunks = iter(chunks)
+        self._encoding = encoding
+        self._pending = b""
+
+    def read(self, size=-1):
+        if size < 0:
+            return b"".join(iter(lambda: self.read(STREAM_SEGMENT_SIZE), b""))
+
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            if isinstance(chunk, str):
+                chunk = chunk.encode(self._encoding)
+            self._pending = memoryview(chunk).cast("B")
+
+        chunk = self._pending[:size]
+        self._pending = self._pending[size:]
+        return bytes(chunk)
+
 
 class FBBLOB(_FBLargeBinary, sqltypes.BLOB):
     __visit_name__ = "BLOB"
@@ -175,8 +289,15 @@ class FBBLOB(_FBLargeBinary, sqltypes.BLOB):
     def __init__(
         self,
         segment_size=None,
+        stream=False,
+        stream_segment_size=None,
     ):
-        super().__init__(0, segment_size)
+        super().__init__(
+            0,
+            segment_size,
+            stream=stream,
+            stream_segment_size=stream_segment_size,
+        )
 
 
 class FBTEXT(_FBLargeBinary, sqltypes.TEXT):
@@ -187,8 +308,17 @@ class FBTEXT(_FBLargeBinary, sqltypes.TEXT):
         segment_size=None,
         charset=None,
         collation=None,
+        stream=False,
+        stream_segment_size=None,
     ):
-        super().__init__(1, segment_size, charset, collation)
+        super().__init__(
+            1,
+            segment_size,
+            charset,
+            collation,
+            stream=stream,
+            stream_segment_size=stream_segment_size,
+        )
 
 
 class _FBNumericInterval(_FBNumeric):
@@ -15,6 +15,11 @@ registry.register("firebird.fdb", "sqlalchemy_firebird.fdb", "FBDialect_fdb")
 registry.register(
     "firebird.firebird", "sqlalchemy_firebird.firebird", "FBDialect_firebird"
 )
+registry.register(
+    "firebird.firebird_async",
+    "sqlalchemy_firebird.firebird_async",
+    "FBDialect_firebird_async",
+)
 
 pytest.register_assert_rewrite("sqlalchemy.testing.assertions")
 
@@ -1,4 +1,5 @@
 from sqlalchemy import Date, Identity, and_
+from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import column
 from sqlalchemy import Column
@@ -20,12 +21,16 @@ from sqlalchemy import update
 from sqlalchemy.sql import sqltypes
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertions import eq_ignore_whitespace
 from sqlalchemy.types import TypeEngine
 
 import sqlalchemy_firebird.types as FbTypes
 
+from sqlalchemy_firebird.base import containing
+from sqlalchemy_firebird.base import keyset_page
+from sqlalchemy_firebird.base import optimize_for
 from sqlalchemy_firebird.firebird import FBDialect_firebird
 
 
@@ -498,3 +503,378 @@ class CompileTest(fixtures.TablesTest, AssertsCompiledSQL):
             select(c1.bitwise_xor(c2)),
             "SELECT BIN_XOR(c1, c2) AS anon_1 FROM rdb$database",
         )
+
+    def test_insertmanyvalues(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, Identity(), primary_key=True),
+            Column("x", String(20)),
+        )
+        stmt = insert(t).returning(t.c.id, sort_by_parameter_order=True)
+        compiled = stmt.compile(
+            dialect=self.__dialect__,
+            for_executemany=True,
+            column_keys=["x"],
+        )
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string,
+                [{"x": "a"}, {"x": "b"}, {"x": "c"}],
+                [{"x": "a"}, {"x": "b"}, {"x": "c"}],
+                None,
+                2,
+                True,
+                None,
+            )
+        )
+
+        eq_ignore_whitespace(
+            batches[0].replaced_statement,
+            "INSERT INTO t (x) SELECT p0 FROM "
+            "(SELECT CAST(:x__0 AS VARCHAR(20)), 0 FROM rdb$database "
+            "UNION ALL SELECT CAST(:x__1 AS VARCHAR(20)), 1 "
+            "FROM rdb$database) "
+            "AS imp_sen(p0, sen_counter) ORDER BY sen_counter "
+            "RETURNING t.id, t.id AS id__1",
+        )
+        eq_ignore_whitespace(
+            batches[1].replaced_statement,
+            "INSERT INTO t (x) SELECT p0 FROM "
+            "(SELECT CAST(:x__0 AS VARCHAR(20)), 0 FROM rdb$database) "
+            "AS imp_sen(p0, sen_counter) ORDER BY sen_counter "
+            "RETURNING t.id, t.id AS id__1",
+        )
+
+    def test_insert_multiple_values(self):
+        t = table("t", column("id", Integer), column("x", String(20)))
+        self.assert_compile(
+            insert(t).values([{"id": 1, "x": "a"}, {"id": 2, "x": "b"}]),
+            "INSERT INTO t (id, x) "
+            "SELECT CAST(:id_m0 AS INTEGER), CAST(:x_m0 AS VARCHAR(20)) "
+            "FROM rdb$database UNION ALL "
+            "SELECT CAST(:id_m1 AS INTEGER), CAST(:x_m1 AS VARCHAR(20)) "
+            "FROM rdb$database",
+        )
+
+        assert_raises_message(
+            exc.CompileError,
+            "more than 250 rows",
+            insert(t)
+            .values([{"id": i, "x": "a"} for i in range(251)])
+            .compile,
+            dialect=self.__dialect__,
+        )
+
+        wide = table("wide", column("id", Integer), column("x", String(8000)))
+        assert_raises_message(
+            exc.CompileError,
+            "may exceed 65535 bytes",
+            insert(wide)
+            .values([{"id": i, "x": "a"} for i in range(3)])
+            .compile,
+            dialect=self.__dialect__,
+        )
+
+        dialect = FBDialect_firebird()
+        dialect.server_version_info = (4, 0)
+        stmt = (
+            insert(t)
+            .values([{"id": 1, "x": "a"}, {"id": 2, "x": "b"}])
+            .returning(t.c.id)
+        )
+        assert_raises_message(
+            exc.CompileError,
+            "requires Firebird 5.0",
+            stmt.compile,
+            dialect=dialect,
+        )
+        dialect.server_version_info = (5, 0)
+        self.assert_compile(
+            stmt,
+            "INSERT INTO t (id, x) "
+            "SELECT CAST(:id_m0 AS INTEGER), CAST(:x_m0 AS VARCHAR(20)) "
+            "FROM rdb$database UNION ALL "
+            "SELECT CAST(:id_m1 AS INTEGER), CAST(:x_m1 AS VARCHAR(20)) "
+            "FROM rdb$database RETURNING t.id",
+            dialect=dialect,
+        )
+
+    def test_timezone_bind_positions(self):
+        dialect = FBDialect_firebird(paramstyle="qmark")
+        dialect.server_version_info = (4, 0)
+        t = table(
+            "t",
+            column("id", Integer),
+            column("x", String(20)),
+            column("ts", sqltypes.DateTime(timezone=True)),
+        )
+
+        def positions(stmt):
+            return stmt.compile(dialect=dialect)._timezone_bind_positions
+
+        eq_(positions(select(t).where(t.c.id == 1, t.c.x == "a")), ())
+        eq_(positions(insert(t).values(id=1, x="a", ts=bindparam("ts"))), (2,))
+        eq_(positions(text("SELECT :p FROM rdb$database")), (0,))
+        eq_(positions(select(t).where(t.c.id.in_([1, 2]))), None)
+
+    def test_minimal_bind_casts(self):
+        dialect = FBDialect_firebird(minimal_bind_casts=True)
+        t = table("t", column("id", Integer), column("x", String(20)))
+
+        self.assert_compile(
+            select(t.c.id, func.coalesce(t.c.x, "b")).where(
+                t.c.x == "a", t.c.id > 5
+            ),
+            "SELECT t.id, coalesce(t.x, CAST(:coalesce_2 AS BLOB SUB_TYPE "
+            "TEXT)) AS coalesce_1 FROM t WHERE t.x = :x_1 AND t.id > :id_1",
+            dialect=dialect,
+        )
+        self.assert_compile(
+            select(t.c.id).where(bindparam("a", 1) == bindparam("b", 2)),
+            "SELECT t.id FROM t "
+            "WHERE CAST(:a AS INTEGER) = CAST(:b AS INTEGER)",
+            dialect=dialect,
+        )
+        self.assert_compile(
+            select(t.c.id).where(t.c.x == "a"),
+            "SELECT t.id FROM t WHERE t.x = CAST(:x_1 AS VARCHAR(20))",
+        )
+
+    def test_pagination_style(self):
+        t = table("t", column("id", Integer))
+        stmt = select(t).order_by(t.c.id).limit(10).offset(20)
+
+        self.assert_compile(
+            stmt,
+            "SELECT FIRST 10 SKIP 20 t.id FROM t ORDER BY t.id",
+            dialect=FBDialect_firebird(pagination_style="first_skip"),
+            render_postcompile=True,
+        )
+        self.assert_compile(
+            select(t).distinct().limit(t.c.id + 1),
+            "SELECT FIRST (t.id + CAST(:id_1 AS INTEGER)) DISTINCT t.id "
+            "FROM t",
+            dialect=FBDialect_firebird(pagination_style="first_skip"),
+        )
+        self.assert_compile(
+            stmt,
+            "SELECT t.id FROM t ORDER BY t.id "
+            "OFFSET 20 ROWS FETCH NEXT 10 ROWS ONLY",
+            dialect=FBDialect_firebird(pagination_style="offset_fetch"),
+            render_postcompile=True,
+        )
+        self.assert_compile(
+            select(t).offset(bindparam("o", type_=Integer)),
+            "SELECT t.id FROM t OFFSET :o ROWS",
+            dialect=FBDialect_firebird(pagination_style="offset_fetch"),
+        )
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value 'top' for pagination_style",
+            FBDialect_firebird,
+            pagination_style="top",
+        )
+
+    def test_optimize_for(self):
+        t = table("t", column("id", Integer))
+        stmt = optimize_for(
+            select(t).order_by(t.c.id).limit(10).with_for_update(),
+            "first rows",
+        )
+
+        self.assert_compile(
+            stmt,
+            "SELECT FIRST 10 t.id FROM t ORDER BY t.id "
+            "FOR UPDATE OPTIMIZE FOR FIRST ROWS",
+            dialect=FBDialect_firebird(pagination_style="first_skip"),
+            render_postcompile=True,
+        )
+        self.assert_compile(
+            select(stmt.subquery()),
+            "SELECT anon_1.id FROM (SELECT FIRST 10 t.id AS id FROM t "
+            "ORDER BY t.id FOR UPDATE) AS anon_1",
+            dialect=FBDialect_firebird(pagination_style="first_skip"),
+            render_postcompile=True,
+        )
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value 'some rows' for optimize_for",
+            optimize_for,
+            select(t),
+            "some rows",
+        )
+
+    def test_plan_hint(self):
+        orders = table("orders", column("id", Integer), column("cid", Integer))
+        customers = table("customers", column("id", Integer)).alias("c")
+
+        def stmt(plan):
+            return (
+                select(orders.c.id)
+                .join_from(orders, customers, orders.c.cid == customers.c.id)
+                .order_by(orders.c.id)
+                .with_for_update()
+                .with_statement_hint(plan, dialect_name="firebird")
+            )
+
+        self.assert_compile(
+            stmt("plan join (orders order pk_orders, c index (pk_customers))"),
+            "SELECT orders.id FROM orders JOIN customers AS c "
+            "ON orders.cid = c.id "
+            "PLAN JOIN (orders ORDER pk_orders, c INDEX (pk_customers)) "
+            "ORDER BY orders.id FOR UPDATE",
+        )
+
+        # Anonymous aliases are named by their table
+        alias = orders.alias()
+        self.assert_compile(
+            select(alias.c.id)
+            .join_from(alias, customers, alias.c.cid == customers.c.id)
+            .with_statement_hint(
+                "PLAN SORT MERGE (SORT (orders NATURAL), SORT (c NATURAL))",
+                dialect_name="firebird",
+            ),
+            "SELECT orders_1.id FROM orders AS orders_1 "
+            "JOIN customers AS c ON orders_1.cid = c.id "
+            "PLAN SORT MERGE (SORT (orders_1 NATURAL), SORT (c NATURAL))",
+        )
+
+        for plan, message in (
+            ("PLAN (products NATURAL)", "is not in the FROM clause"),
+            ("PLAN JOIN (orders NATURAL)", "Invalid PLAN expression"),
+            ("PLAN (orders INDEX ())", "Invalid PLAN expression"),
+        ):
+            assert_raises_message(
+                exc.CompileError,
+                message,
+                stmt(plan).compile,
+                dialect=self.__dialect__,
+            )
+
+    def test_starting_with(self):
+        t = table("t", column("x", String(20)))
+        dialect = FBDialect_firebird(use_starting_with=True)
+
+        # LIKE wildcards are kept by default
+        self.assert_compile(
+            t.c.x.startswith("a_"),
+            "t.x LIKE CAST(:x_1 AS VARCHAR(20)) || '%'",
+        )
+
+        stmt = t.c.x.startswith("a%b/", autoescape=True)
+        self.assert_compile(
+            stmt,
+            "t.x STARTING WITH CAST(:x_1 AS VARCHAR(20))",
+            checkparams={"x_1": "a/%b//"},
+            dialect=dialect,
+        )
+        compiled = stmt.compile(dialect=dialect)
+        eq_(compiled._bind_processors["x_1"]("a/%b//"), "a%b/")
+        self.assert_compile(
+            column("y", FbTypes.FBVARCHAR(20, charset="WIN1252")).startswith(
+                "a_", autoescape=True
+            ),
+            "y STARTING WITH CAST(:y_1 AS VARCHAR(20) CHARACTER SET WIN1252)",
+            checkparams={"y_1": "a/_"},
+            dialect=dialect,
+        )
+        self.assert_compile(
+            ~t.c.x.startswith("a"),
+            "t.x NOT STARTING WITH :x_1",
+            dialect=FBDialect_firebird(
+                minimal_bind_casts=True, use_starting_with=True
+            ),
+        )
+        self.assert_compile(
+            t.c.x.startswith(t.c.x, escape="/"),
+            "t.x LIKE t.x || '%' ESCAPE '/'",
+            dialect=dialect,
+        )
+        self.assert_compile(
+            containing(t.c.x, "a"),
+            "t.x CONTAINING CAST(:x_1 AS VARCHAR(20))",
+        )
+
+    def test_case_insensitive_collation(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("x", String(20)),
+            Column("y", String(20), firebird_case_insensitive=True),
+            Column("z", FbTypes.FBVARCHAR(20, collation="UNICODE_CI_AI")),
+        )
+        dialect = FBDialect_firebird(
+            case_insensitive_collation="UNICODE_CI", use_starting_with=True
+        )
+
+        self.assert_compile(
+            t.c.x.ilike("a%"),
+            "lower(t.x) LIKE lower(CAST(:x_1 AS VARCHAR(20)))",
+        )
+        self.assert_compile(
+            t.c.x.ilike("a%"),
+            "t.x COLLATE UNICODE_CI LIKE CAST(:x_1 AS VARCHAR(20))",
+            dialect=dialect,
+        )
+        self.assert_compile(
+            ~t.c.x.istartswith("a"),
+            "t.x COLLATE UNICODE_CI NOT STARTING WITH "
+            "CAST(:x_1 AS VARCHAR(20))",
+            dialect=dialect,
+        )
+        self.assert_compile(
+            t.c.y.icontains("a"),
+            "t.y LIKE '%' || CAST(:y_1 AS VARCHAR(20)) || '%'",
+        )
+        self.assert_compile(
+            t.alias("u").c.y.iendswith("a"),
+            "u.y LIKE '%' || CAST(:y_1 AS VARCHAR(20))",
+        )
+        self.assert_compile(
+            t.c.z.istartswith("a"),
+            "t.z LIKE CAST(:z_1 AS VARCHAR(20) COLLATE UNICODE_CI_AI) || '%'",
+        )
+        self.assert_compile(
+            t.c.z.istartswith("a"),
+            "t.z STARTING WITH "
+            "CAST(:z_1 AS VARCHAR(20) COLLATE UNICODE_CI_AI)",
+            dialect=dialect,
+        )
+
+    def test_keyset_page(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("a", Integer),
+            Column("b", String(20)),
+        )
+        dialect = FBDialect_firebird(pagination_style="first_skip")
+
+        self.assert_compile(
+            keyset_page(select(t).order_by(t.c.b), [t.c.a], None, 10),
+            "SELECT FIRST 10 t.a, t.b FROM t ORDER BY t.a",
+            dialect=dialect,
+            render_postcompile=True,
+        )
+        self.assert_compile(
+            keyset_page(select(t), [t.c.a, t.c.b.desc()], (1, "x"), 10),
+            "SELECT FIRST 10 t.a, t.b FROM t "
+            "WHERE t.a >= CAST(:a_1 AS INTEGER) "
+            "AND (t.a > CAST(:a_2 AS INTEGER) "
+            "OR t.a = CAST(:a_3 AS INTEGER) "
+            "AND t.b < CAST(:b_1 AS VARCHAR(20))) "
+            "ORDER BY t.a, t.b DESC",
+            checkparams={"a_1": 1, "a_2": 1, "a_3": 1, "b_1": "x"},
+            dialect=dialect,
+            render_postcompile=True,
+        )
+
+        index = Index("ix", t.c.a, firebird_descending=True)
+        self.assert_compile(
+            keyset_page(select(t), index, (1,), 10),
+            "SELECT FIRST 10 t.a, t.b FROM t "
+            "WHERE t.a < CAST(:a_1 AS INTEGER) ORDER BY t.a DESC",
+            dialect=dialect,
+            render_postcompile=True,
+        )
@@ -1,26 +1,37 @@
 import datetime
+from decimal import Decimal
 
 from sqlalchemy import bindparam
 from sqlalchemy import cast
 from sqlalchemy import Column
+from sqlalchemy import create_engine
 from sqlalchemy import DateTime
+from sqlalchemy import exc
 from sqlalchemy import extract
 from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import MetaData
+from sqlalchemy import Numeric
 from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertions import AssertsCompiledSQL
 from sqlalchemy.testing.assertions import AssertsExecutionResults
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import expect_raises
+from sqlalchemy_firebird.base import bulk_load
+from sqlalchemy_firebird.base import containing
+from sqlalchemy_firebird.base import optimize_for
+
+import sqlalchemy_firebird.types as fb_types
 
 
 class ConnectionTest(fixtures.TablesTest):
@@ -47,6 +58,271 @@ class ConnectionTest(fixtures.TablesTest):
         except Exception as err:
             eq_(testing.db.dialect.is_disconnect(err.orig, None, None), True)
 
+    def test_do_ping(self):
+        with testing.db.connect() as conn:
+            dbapi_conn = conn.connection.dbapi_connection
+            eq_(testing.db.dialect.do_ping(dbapi_conn), True)
+
+    def test_pre_ping_disconnect(self):
+        eng = engines.testing_engine(options={"pool_pre_ping": True})
+
+        with eng.connect() as conn:
+            con1_id = conn.exec_driver_sql(
+                "SELECT CURRENT_CONNECTION FROM rdb$database"
+            ).scalar()
+
+        with testing.db.begin() as other_conn:
+            other_conn.exec_driver_sql(
+                "DELETE FROM mon$attachments WHERE mon$attachment_id = ?",
+                (con1_id,),
+            )
+
+        # The killed connection is replaced on checkout
+        with eng.connect() as conn:
+            con2_id = conn.exec_driver_sql(
+                "SELECT CURRENT_CONNECTION FROM rdb$database"
+            ).scalar()
+            assert con2_id != con1_id
+
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Transaction state is checked with firebird-driver.",
+    )
+    def test_commit_retaining(self):
+        eng = engines.testing_engine(
+            options={
+                "commit_retaining_max_count": 2,
+                "execution_options": {"commit_retaining": True},
+            }
+        )
+
+        active_after_commit = []
+        with eng.connect() as conn:
+            for _ in range(3):
+                conn.exec_driver_sql("SELECT 1 FROM rdb$database").scalar()
+                conn.commit()
+                active_after_commit.append(
+                    conn.connection.dbapi_connection.is_active()
+                )
+
+        # The third commit is a hard commit
+        eq_(active_after_commit, [True, True, False])
+
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Isolation levels require firebird-driver.",
+    )
+    def test_read_only_engine(self):
+        eng = engines.testing_engine(options={"read_only": True})
+
+        with eng.connect() as conn:
+            eq_(conn.get_isolation_level(), "READ COMMITTED READ ONLY")
+            eq_(conn.scalar(text("SELECT 1 FROM rdb$database")), 1)
+
+            with expect_raises(exc.DBAPIError):
+                conn.exec_driver_sql("CREATE SEQUENCE read_only_seq")
+
+            conn.rollback()
+            conn = conn.execution_options(isolation_level="REPEATABLE READ")
+            eq_(conn.get_isolation_level(), "REPEATABLE READ")
+
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Lock resolution options require firebird-driver.",
+    )
+    def test_lock_timeout(self):
+        from firebird.driver import Isolation
+        from firebird.driver import TPB
+
+        eng = engines.testing_engine(options={"lock_timeout": 2})
+
+        def tpb(conn):
+            result = TPB()
+            result.parse_buffer(
+                conn.connection.dbapi_connection.main_transaction.default_tpb
+            )
+            return result
+
+        with eng.connect() as conn:
+            eq_(tpb(conn).lock_timeout, 2)
+
+            conn = conn.execution_options(
+                isolation_level="READ COMMITTED",
+                read_committed_mode="NO RECORD VERSION",
+                lock_timeout=0,
+            )
+            eq_(tpb(conn).lock_timeout, 0)
+            eq_(
+                tpb(conn).isolation, Isolation.READ_COMMITTED_NO_RECORD_VERSION
+            )
+            eq_(conn.scalar(text("SELECT 1 FROM rdb$database")), 1)
+
+        # Reset when the connection is returned to the pool
+        with eng.connect() as conn:
+            eq_(tpb(conn).lock_timeout, 2)
+            eq_(tpb(conn).isolation, Isolation.SNAPSHOT)
+
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "max_inline_blob_size requires firebird-driver.",
+    )
+    def test_max_inline_blob_size(self):
+        # Ignored by servers older than Firebird 5.0.3
+        eng = engines.testing_engine(options={"max_inline_blob_size": 1024})
+        with eng.connect() as conn:
+            eq_(
+                conn.scalar(
+                    text(
+                        "SELECT CAST('abc' AS BLOB SUB_TYPE TEXT) "
+                        "FROM rdb$database"
+                    )
+                ),
+                "abc",
+            )
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb"
+        or not config.db.url.host,
+        "driver_config registration requires firebird-driver and a host.",
+    )
+    def test_driver_config_unregistered_on_dispose(self):
+        from firebird.driver import driver_config
+
+        eng = engines.testing_engine()
+        database_name = eng.dialect.create_connect_args(eng.url)[1]["database"]
+        assert driver_config.get_database(database_name) is not None
+
+        eng.dispose()
+        # Still registered by testing.db
+        assert driver_config.get_database(database_name) is not None
+
+        # Registered again when the disposed engine is used
+        with eng.connect() as conn:
+            eq_(conn.scalar(text("SELECT 1 FROM rdb$database")), 1)
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Connect arguments cache requires firebird-driver.",
+    )
+    def test_connect_args_evicted_on_dispose(self):
+        from sqlalchemy_firebird.firebird import _connect_args_cache
+
+        url = testing.db.url.set(
+            drivername="firebird+firebird",
+            host="evicted.invalid",
+            password="secret",
+        )
+        eng = create_engine(url)
+        assert url in _connect_args_cache
+
+        eng.dispose()
+        assert url not in _connect_args_cache
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Charset mapping requires firebird-driver.",
+    )
+    def test_blob_encoding_lowercase_charset(self):
+        url = testing.db.url.set(drivername="firebird+firebird")
+        eng = create_engine(url.update_query_dict({"charset": "utf8"}))
+        processor = fb_types.FBTEXT().bind_processor(eng.dialect)
+        eq_(processor(iter(["lí", "nea"])).read(), "línea".encode("utf-8"))
+        eng.dispose()
+
+
+class BulkLoadTest(fixtures.TablesTest):
+    __backend__ = True
+
+    run_deletes = None
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "bulk_data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50), index=True),
+        )
+        Table(
+            "bulk_data_no_index",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50), unique=True),
+        )
+
+    def _inactive_flags(self, connection):
+        result = connection.exec_driver_sql(
+            "SELECT COALESCE(rdb$index_inactive, 0) FROM rdb$indices "
+            "WHERE rdb$relation_name = 'BULK_DATA' "
+            "AND rdb$index_name STARTING WITH 'IX_'"
+        )
+        return result.scalars().all()
+
+    def test_bulk_load(self):
+        table = self.tables.bulk_data
+
+        with testing.db.connect() as conn:
+            with bulk_load(conn, table):
+                eq_(self._inactive_flags(conn), [1])
+                conn.execute(
+                    table.insert(),
+                    [{"id": i, "x": "x%d" % i} for i in range(1, 101)],
+                )
+
+            eq_(self._inactive_flags(conn), [0])
+            eq_(conn.scalar(select(func.count()).select_from(table)), 100)
+            conn.rollback()
+
+    def test_bulk_load_error(self):
+        table = self.tables.bulk_data
+
+        with testing.db.connect() as conn:
+            with expect_raises(exc.DatabaseError):
+                with bulk_load(conn, "bulk_data"):
+                    conn.execute(table.insert(), [{"id": 1}, {"id": 1}])
+
+            eq_(self._inactive_flags(conn), [0])
+            conn.rollback()
+
+    def test_bulk_load_no_index(self):
+        # Only constraint indexes, none is deactivated
+        table = self.tables.bulk_data_no_index
+
+        with testing.db.connect() as conn:
+            with bulk_load(conn, table):
+                conn.execute(table.insert(), [{"id": 1, "x": "a"}])
+
+            eq_(conn.scalar(select(func.count()).select_from(table)), 1)
+            conn.rollback()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "no_auto_undo requires firebird-driver.",
+    )
+    def test_bulk_load_restores_no_auto_undo(self):
+        table = self.tables.bulk_data
+
+        eng = engines.testing_engine(options={"no_auto_undo": True})
+        with eng.connect() as conn:
+            with bulk_load(conn, table):
+                pass
+            eq_(conn.get_execution_options()["no_auto_undo"], True)
+            eq_(
+                conn.connection.dbapi_connection._tpb_options.no_auto_undo,
+                True,
+            )
+        eng.dispose()
+
 
 #
 # Tests from postgresql/test_dialect.py
@@ -82,6 +358,14 @@ class ExecuteManyTest(fixtures.TablesTest):
             Column("z", Integer, server_default="5"),
         )
 
+        Table(
+            "numbers",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("n", Numeric(18, 0)),
+            Column("d", Numeric(10, 2)),
+        )
+
         Table(
             "Unitéble2",
             metadata,
@@ -129,6 +413,89 @@ class ExecuteManyTest(fixtures.TablesTest):
             [(1, "x1", "y5", 5), (2, "x2", "y2", 5), (3, "x3", "y6", 5)],
         )
 
+    @testing.requires.sane_multi_rowcount
+    def test_update_rowcount(self, connection):
+        connection.execute(
+            self.tables.data.insert(),
+            [
+                {"id": 1, "x": "x1", "y": "y1"},
+                {"id": 2, "x": "x2", "y": "y2"},
+                {"id": 3, "x": "x2", "y": "y3"},
+            ],
+        )
+
+        result = connection.execute(
+            self.tables.data.update()
+            .where(self.tables.data.c.x == bindparam("xval"))
+            .values(y=bindparam("yval")),
+            [
+                {"xval": "x1", "yval": "y5"},
+                {"xval": "x2", "yval": "y6"},
+                {"xval": "x9", "yval": "y7"},
+            ],
+        )
+        eq_(result.rowcount, 3)
+
+    @testing.requires.firebird_4_or_higher
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Batched executemany requires firebird-driver.",
+    )
+    def test_insert_batched(self):
+        eng = engines.testing_engine(
+            options={"use_reaper": False, "executemany_batch_size": 2}
+        )
+        table = self.tables.data
+
+        with eng.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [
+                    {"id": 1, "x": "x1", "y": None},
+                    {"id": 2, "x": "x2", "y": "y2"},
+                    {"id": 3, "x": None, "y": "y3"},
+                ],
+            )
+
+            eq_(
+                conn.execute(select(table).order_by(table.c.id)).fetchall(),
+                [(1, "x1", None, 5), (2, "x2", "y2", 5), (3, None, "y3", 5)],
+            )
+
+        eng.dispose()
+
+    @testing.requires.firebird_4_or_higher
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Batched executemany requires firebird-driver.",
+    )
+    def test_insert_batched_numeric(self):
+        eng = engines.testing_engine(
+            options={"use_reaper": False, "executemany_batch_size": 2}
+        )
+        table = self.tables.numbers
+
+        with eng.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [
+                    {"id": 1, "n": Decimal("12"), "d": Decimal("1.25")},
+                    {"id": 2, "n": 34, "d": 5},
+                    {"id": 3, "n": Decimal("-56"), "d": None},
+                ],
+            )
+
+            eq_(
+                conn.execute(select(table).order_by(table.c.id)).fetchall(),
+                [
+                    (1, Decimal("12"), Decimal("1.25")),
+                    (2, Decimal("34"), Decimal("5.00")),
+                    (3, Decimal("-56"), None),
+                ],
+            )
+
+        eng.dispose()
+
 
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
@@ -264,3 +631,138 @@ class MiscBackendTest(
             "SELECT 1 FROM rdb$database UNION ALL SELECT 2 FROM rdb$database"
         )
         eq_(cursor.rowcount, 0)
+
+    def test_stream_results_yield_per(self, connection):
+        result = connection.execution_options(
+            stream_results=True, yield_per=2
+        ).exec_driver_sql(
+            "SELECT 1 FROM rdb$database UNION ALL "
+            "SELECT 2 FROM rdb$database UNION ALL "
+            "SELECT 3 FROM rdb$database"
+        )
+        eq_(result.cursor.arraysize, 2)
+        eq_(result.scalars().all(), [1, 2, 3])
+
+    @testing.requires.datetime_timezone
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "session_time_zone requires firebird-driver.",
+    )
+    def test_session_time_zone(self):
+        eng = engines.testing_engine(
+            options={"session_time_zone": "America/Sao_Paulo"}
+        )
+        value = datetime.datetime(
+            2024, 1, 2, 12, 30, tzinfo=datetime.timezone.utc
+        )
+        with eng.connect() as conn:
+            session_time_zone = conn.scalar(
+                text(
+                    "SELECT RDB$GET_CONTEXT('SYSTEM', 'SESSION_TIMEZONE') "
+                    "FROM rdb$database"
+                )
+            )
+            eq_(session_time_zone, "America/Sao_Paulo")
+            result = conn.scalar(
+                select(literal(value, DateTime(timezone=True)))
+            )
+            eq_(result, value)
+            eq_(result.utcoffset(), datetime.timedelta(hours=-3))
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Prepared statement cache requires firebird-driver.",
+    )
+    def test_prepared_statement_cache(self):
+        eng = engines.testing_engine(
+            options={"prepared_statement_cache_size": 1}
+        )
+        stmt_1 = select(literal(1, Integer))
+        stmt_2 = select(literal(2, Integer))
+
+        with eng.connect() as conn:
+            for stmt, value in ((stmt_1, 1), (stmt_1, 1), (stmt_2, 2)):
+                eq_(conn.scalar(stmt), value)
+
+            # A result still open on another cursor is not shared
+            result = conn.execute(stmt_2)
+            eq_(conn.scalar(stmt_2), 2)
+            eq_(result.scalar(), 2)
+
+            cache = conn.connection.info["prepared_statement_cache"]
+            eq_(
+                (cache.hits, cache.misses, cache.evictions, len(cache)),
+                (2, 3, 1, 1),
+            )
+
+        eng.dispose()
+
+    def test_starting_with(self, connection):
+        value = literal("a%b_c", String(10))
+        eng = engines.testing_engine(options={"use_starting_with": True})
+
+        def matches(condition, conn=connection):
+            return conn.scalar(select(literal(1)).where(condition))
+
+        # LIKE wildcards by default
+        eq_(matches(value.startswith("a_")), 1)
+        eq_(matches(~value.startswith("a_")), None)
+
+        with eng.connect() as conn:
+            eq_(matches(value.startswith("a%b_", autoescape=True), conn), 1)
+            eq_(matches(value.startswith("a^%b", escape="^"), conn), 1)
+            eq_(matches(value.startswith("a_"), conn), None)
+            eq_(matches(~value.startswith("a_"), conn), 1)
+        eq_(matches(containing(value, "B_C")), 1)
+        eng.dispose()
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.server_version_info < (5,),
+        "OPTIMIZE FOR requires Firebird 5.",
+    )
+    def test_optimize_for(self):
+        stmt = select(literal(1, Integer))
+
+        with testing.db.connect() as conn:
+            eq_(conn.scalar(optimize_for(stmt, "first rows")), 1)
+
+            conn.execution_options(optimize_for="all_rows")
+            eq_(conn.get_execution_options()["optimize_for"], "all_rows")
+            eq_(conn.scalar(stmt), 1)
+
+            with expect_raises(exc.ArgumentError):
+                conn.execution_options(optimize_for="some rows")
+
+    @testing.skip_if(
+        lambda config: config.db.dialect.driver == "fdb",
+        "Async dialect requires firebird-driver.",
+    )
+    @config.async_test
+    async def test_async_engine(self):
+        engine = create_async_engine(
+            testing.db.url.set(drivername="firebird+firebird_async"),
+            max_workers=2,
+        )
+        async with engine.connect() as conn:
+            result = await conn.stream(
+                text(
+                    "SELECT 1 FROM rdb$database UNION ALL "
+                    "SELECT 2 FROM rdb$database"
+                )
+            )
+            eq_(await result.scalars().all(), [1, 2])
+            eq_(
+                await conn.scalar(text("SELECT 3 FROM rdb$database")),
+                3,
+            )
+        await engine.dispose()
+        eq_(engine.sync_engine.dialect._executor, None)
+
+        # A new thread pool is created after dispose()
+        async with engine.connect() as conn:
+            eq_(
+                await conn.scalar(text("SELECT 4 FROM rdb$database")),
+                4,
+            )
+        await engine.dispose()
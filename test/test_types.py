@@ -1,6 +1,10 @@
+import array
+import io
+
 from sqlalchemy import Column
 from sqlalchemy import Float
 from sqlalchemy import MetaData
+from sqlalchemy import select
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy.testing import eq_
@@ -11,7 +15,6 @@ from sqlalchemy.testing import is_not_none
 import sqlalchemy.types as sa_types
 import sqlalchemy_firebird.types as fb_types
 
-
 TEST_CHARSET = "UTF8"
 TEST_COLLATION = "UNICODE_CI"
 
@@ -72,6 +75,76 @@ class TypesTest(fixtures.TestBase):
             collation=TEST_COLLATION,
         )
 
+    @testing.provide_metadata
+    def test_blob_stream(self, connection):
+        t = Table(
+            "test_blob_stream",
+            self.metadata,
+            Column("b", fb_types.FBBLOB(stream=True, stream_segment_size=7)),
+            Column("t", fb_types.FBTEXT(stream=True, stream_segment_size=7)),
+            Column("ft", fb_types.FBTEXT),
+        )
+        self.metadata.create_all(testing.db)
+
+        binary_value = bytes(range(256)) * 1000
+        text_value = "línea\n" * 1000
+        connection.execute(
+            t.insert(), dict(b=binary_value, t=text_value, ft=text_value)
+        )
+
+        for row in connection.execute(t.select()):
+            eq_(row.b.read(), binary_value)
+            eq_(row.t.readline(), "línea\n")
+            eq_(row.t.read(), text_value[len("línea\n") :])
+            eq_(row.ft, text_value)
+
+    @testing.provide_metadata
+    def test_blob_stream_parameters(self, connection):
+        t = Table(
+            "test_blob_stream_parameters",
+            self.metadata,
+            Column("id", sa_types.Integer),
+            Column("b", fb_types.FBBLOB),
+        )
+        self.metadata.create_all(testing.db)
+
+        value = bytes(range(256)) * 1000
+        chunks = [value[i : i + 1000] for i in range(0, len(value), 1000)]
+        connection.execute(
+            t.insert(),
+            [
+                dict(id=1, b=bytearray(value)),
+                dict(id=2, b=memoryview(value)),
+                dict(id=3, b=io.BytesIO(value)),
+                dict(id=4, b=iter(chunks)),
+                dict(id=5, b=array.array("B", value)),
+            ],
+        )
+
+        eq_(
+            connection.execute(select(t.c.b).order_by(t.c.id)).all(),
+            [(value,)] * 5,
+        )
+
+    @testing.provide_metadata
+    def test_text_blob_chunk_parameters(self, connection):
+        t = Table(
+            "test_text_blob_chunk_parameters",
+            self.metadata,
+            Column("t", fb_types.FBTEXT),
+        )
+        self.metadata.create_all(testing.db)
+
+        # Non-ASCII chunks are longer in bytes than in characters
+        value = "línea €\n" * 20000
+        connection.execute(
+            t.insert(),
+            dict(
+                t=iter(value[i : i + 1000] for i in range(0, len(value), 1000))
+            ),
+        )
+        eq_(connection.scalar(select(t.c.t)), value)
+
     @testing.provide_metadata
     def test_character_types(self, connection):
         t = Table(